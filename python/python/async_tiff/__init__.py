@@ -8,6 +8,7 @@ from ._async_tiff import (
     ImageFileDirectory,
     ThreadPool,
     Tile,
+    TileStream,
     ___version,  # noqa: F403 # pyright:ignore[reportAttributeAccessIssue]
 )
 from ._decoder_runtime import Decoder
@@ -27,4 +28,5 @@ __all__ = [
     "TIFF",
     "ObspecInput",
     "Tile",
+    "TileStream",
 ]
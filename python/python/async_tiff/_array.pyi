@@ -28,10 +28,20 @@ class Array(Buffer):
     ```
     """
 
-    # This is intended only for tests
-    # def __init__(
-    #     self, data: Buffer, shape: tuple[int, int, int], format: str
-    # ) -> None: ...
+    def __init__(
+        self, data: Buffer, shape: tuple[int, int, int], format: str
+    ) -> None:
+        """Construct an Array from an existing buffer.
+
+        C-contiguous buffers, such as `bytes` or a contiguous numpy array, are used
+        without copying, and are kept alive for as long as the Array exists.
+        Non-contiguous buffers are copied into C order.
+
+        Args:
+            data: Any object implementing the buffer protocol.
+            shape: The 3D shape of the array.
+            format: A buffer protocol format string for the element type, e.g. `"<H"`.
+        """
     def __buffer__(self, flags: int) -> memoryview[int]: ...
     @property
     def shape(self) -> tuple[int, int, int]:
@@ -3,6 +3,7 @@ from ._colormap import Colormap
 from ._decoder import DecoderRegistry
 from ._geo import GeoKeyDirectory
 from ._ifd import ImageFileDirectory
+from ._stream import TileStream
 from ._thread_pool import ThreadPool
 from ._tiff import TIFF
 from ._tile import Tile
@@ -16,4 +17,5 @@ __all__ = [
     "ThreadPool",
     "TIFF",
     "Tile",
+    "TileStream",
 ]
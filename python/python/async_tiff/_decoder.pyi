@@ -12,6 +12,10 @@ class DecoderRegistry:
         compression types. Only the supplied decoders will override Rust-native
         decoders.
 
+        Rust-native decoders run without holding the GIL. A custom Python decoder
+        acquires the GIL only while its own callback runs, so prefer leaving the
+        built-in decoders in place unless you need to override them.
+
         Args:
             custom_decoders: any custom decoder methods to use. This will be applied
                 _after_ (and override) any default provided Rust decoders. Defaults to
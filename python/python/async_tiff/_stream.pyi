@@ -0,0 +1,11 @@
+from ._array import Array
+
+class TileStream:
+    """An async iterator over decoded tiles, created by [`TIFF.stream_tiles`][async_tiff.TIFF.stream_tiles].
+
+    Tiles are fetched and decoded in the background, so fetching the next tiles
+    overlaps with decoding the current ones. At most a few tiles are buffered ahead of
+    the consumer.
+    """
+    def __aiter__(self) -> TileStream: ...
+    async def __anext__(self) -> Array: ...
@@ -1,7 +1,11 @@
 from typing import Sequence
 
+from ._array import Array
+from ._decoder import DecoderRegistry
 from ._ifd import ImageFileDirectory
 from ._input import ObspecInput
+from ._stream import TileStream
+from ._thread_pool import ThreadPool
 from ._tile import Tile
 from .enums import Endianness
 from .store import ObjectStore
@@ -15,6 +19,7 @@ class TIFF:
         store: ObjectStore | ObspecInput,
         prefetch: int = 32768,
         multiplier: int | float = 2.0,
+        coalesce_window: int = 16 * 1024 * 1024,
     ) -> TIFF:
         """Open a new TIFF.
 
@@ -26,6 +31,11 @@ class TIFF:
                 greater than 1.0. For example, for a value of `2.0`, the first metadata
                 read will be of size `prefetch`, and then the next read will be of size
                 `prefetch * 2`.
+            coalesce_window: The maximum size in bytes of a merged request when fetching
+                multiple tiles from an obspec backend. Tiles that are close together in
+                the file are fetched with a single range request up to this size. Set to
+                `0` to disable coalescing. `ObjectStore` instances already coalesce
+                requests internally, so this has no effect for them.
 
         Returns:
             A TIFF instance.
@@ -84,3 +94,61 @@ class TIFF:
         Returns:
             Tile responses.
         """
+    def stream_tiles(
+        self,
+        xy: Sequence[tuple[int, int]],
+        z: int,
+        *,
+        decoder_registry: DecoderRegistry | None = None,
+        pool: ThreadPool | None = None,
+    ) -> TileStream:
+        """Fetch and decode multiple tiles as a pipelined stream.
+
+        Tiles are fetched in small batches and decoded on the thread pool while the
+        next batch is being fetched, overlapping network IO with decompression.
+        Decoded arrays are yielded in the same order as `xy`.
+
+        ```py
+        async for array in tiff.stream_tiles([(0, 0), (1, 0)], 0):
+            ...
+        ```
+
+        Args:
+            xy: The (column, row) indexes within the ifd to read from.
+            z: The IFD index to read from.
+
+        Keyword Args:
+            decoder_registry: the decoders to use for decompression. Defaults to None, in which case a default decoder registry is used.
+            pool: the thread pool on which to run decompression. Defaults to None, in
+                which case, a default thread pool is used.
+
+        Returns:
+            An async iterator of decoded arrays.
+        """
+    async def decode_tiles(
+        self,
+        tiles: Sequence[Tile],
+        *,
+        decoder_registry: DecoderRegistry | None = None,
+        pool: ThreadPool | None = None,
+    ) -> list[Array]:
+        """Decode multiple tiles in parallel.
+
+        The whole batch is decoded as one job on the thread pool, so tiles are
+        decompressed concurrently across the pool's threads. This avoids the
+        per-tile scheduling overhead of awaiting [`Tile.decode`][async_tiff.Tile.decode]
+        for each tile individually.
+
+        Each tile is consumed by this call and cannot be decoded again.
+
+        Args:
+            tiles: The tiles to decode.
+
+        Keyword Args:
+            decoder_registry: the decoders to use for decompression. Defaults to None, in which case a default decoder registry is used.
+            pool: the thread pool on which to run decompression. Defaults to None, in
+                which case, a default thread pool is used.
+
+        Returns:
+            Decoded arrays, in the same order as `tiles`.
+        """
@@ -34,9 +34,11 @@ use std::ffi::CStr;
 use std::os::raw::c_int;
 
 use async_tiff::{Array, DataType, TypedArray};
+use bytes::Bytes;
 use pyo3::exceptions::PyValueError;
-use pyo3::ffi;
 use pyo3::prelude::*;
+use pyo3::types::PyMemoryView;
+use pyo3::{ffi, intern};
 use pyo3_bytes::PyBytes;
 
 use crate::error::PyAsyncTiffResult;
@@ -68,7 +70,7 @@ fn data_type_to_numpy_char(dtype: &DataType) -> char {
     }
 }
 
-/// Returns the buffer protocol format string type character (without endianness prefix).
+/// Returns the buffer protocol format string for the element type, including its byte order.
 ///
 /// The format string uses Python's struct module syntax:
 ///   - 'B'/'b' = unsigned/signed 8-bit
@@ -77,23 +79,34 @@ fn data_type_to_numpy_char(dtype: &DataType) -> char {
 ///   - 'Q'/'q' = unsigned/signed 64-bit
 ///   - 'f'/'d' = 32/64-bit float
 ///
+/// Multi-byte types are prefixed with '<' (little-endian) or '>' (big-endian), so that a consumer
+/// such as numpy reads the bytes in the order they are actually stored.
+///
 /// Note: These are distinct from numpy dtype strings! Numpy uses "<u2"
 /// while the buffer protocol uses "<H" for the same type (little-endian uint16).
 ///
 /// See: https://docs.python.org/3/library/struct.html#format-characters
-fn data_type_to_buffer_format(data_type: &DataType) -> &'static CStr {
+fn data_type_to_buffer_format(data_type: &DataType, big_endian: bool) -> &'static CStr {
     use DataType::*;
-    match data_type {
-        Bool | UInt8 => c"B",
-        UInt16 => c"H",
-        UInt32 => c"I",
-        UInt64 => c"Q",
-        Int8 => c"b",
-        Int16 => c"h",
-        Int32 => c"i",
-        Int64 => c"q",
-        Float32 => c"f",
-        Float64 => c"d",
+    match (data_type, big_endian) {
+        (Bool | UInt8, _) => c"B",
+        (Int8, _) => c"b",
+        (UInt16, false) => c"<H",
+        (UInt16, true) => c">H",
+        (UInt32, false) => c"<I",
+        (UInt32, true) => c">I",
+        (UInt64, false) => c"<Q",
+        (UInt64, true) => c">Q",
+        (Int16, false) => c"<h",
+        (Int16, true) => c">h",
+        (Int32, false) => c"<i",
+        (Int32, true) => c">i",
+        (Int64, false) => c"<q",
+        (Int64, true) => c">q",
+        (Float32, false) => c"<f",
+        (Float32, true) => c">f",
+        (Float64, false) => c"<d",
+        (Float64, true) => c">d",
     }
 }
 
@@ -113,54 +126,87 @@ fn data_type_to_buffer_format(data_type: &DataType) -> &'static CStr {
 ///
 /// Examples: "<H", ">f", "B", "@i"
 ///
-/// Note: The endianness prefix is accepted but not returned. Callers should
-/// validate that the actual data endianness matches separately if needed.
-fn parse_buffer_format_string(s: &str) -> PyResult<DataType> {
-    let mut chars = s.chars();
-
-    // Check for optional endianness prefix
-    let first_char = chars
-        .next()
-        .ok_or_else(|| PyValueError::new_err("empty format string"))?;
+/// Returns the data type and whether the data is big-endian. Native and missing prefixes resolve
+/// to the byte order of the current platform.
+fn parse_buffer_format_string(s: &str) -> PyResult<(DataType, bool)> {
+    const NATIVE_BIG_ENDIAN: bool = cfg!(target_endian = "big");
 
-    // Determine if first character is an endianness prefix
-    let type_char = match first_char {
-        '<' | '>' | '@' | '=' | '|' => {
-            // Endianness prefix found, next character should be the type
-            chars
-                .next()
-                .ok_or_else(|| PyValueError::new_err("missing type character after endianness"))?
+    // Format strings are at most two ASCII bytes, so match on the raw bytes directly.
+    let (big_endian, type_char) = match s.as_bytes() {
+        [] => return Err(PyValueError::new_err("empty format string")),
+        [b'<' | b'>' | b'@' | b'=' | b'|'] => {
+            return Err(PyValueError::new_err(
+                "missing type character after endianness",
+            ))
+        }
+        [b'<', c] => (false, *c),
+        [b'>', c] => (true, *c),
+        [b'@' | b'=' | b'|', c] | [c] => (NATIVE_BIG_ENDIAN, *c),
+        _ => {
+            return Err(PyValueError::new_err(format!(
+                "unexpected characters after format: '{s}'"
+            )))
         }
-        // No endianness prefix, first character is the type
-        c => c,
     };
 
     let dtype = match type_char {
-        'B' => DataType::UInt8,
-        'H' => DataType::UInt16,
-        'I' => DataType::UInt32,
-        'Q' => DataType::UInt64,
-        'b' => DataType::Int8,
-        'h' => DataType::Int16,
-        'i' => DataType::Int32,
-        'q' => DataType::Int64,
-        'f' => DataType::Float32,
-        'd' => DataType::Float64,
+        b'B' => DataType::UInt8,
+        b'H' => DataType::UInt16,
+        b'I' => DataType::UInt32,
+        b'Q' => DataType::UInt64,
+        b'b' => DataType::Int8,
+        b'h' => DataType::Int16,
+        b'i' => DataType::Int32,
+        b'q' => DataType::Int64,
+        b'f' => DataType::Float32,
+        b'd' => DataType::Float64,
         c => {
             return Err(PyValueError::new_err(format!(
-                "invalid type character: '{c}'"
+                "invalid type character: '{}'",
+                char::from(c)
             )))
         }
     };
 
-    // Ensure no extra characters after the type
-    if chars.next().is_some() {
-        return Err(PyValueError::new_err(format!(
-            "unexpected characters after format: '{s}'"
-        )));
+    Ok((dtype, big_endian))
+}
+
+/// Read any object implementing the buffer protocol as raw bytes.
+///
+/// C-contiguous buffers are viewed without copying, whatever their item format. Other buffers,
+/// e.g. a strided numpy view, are copied into a new contiguous buffer in C order.
+pub(crate) fn buffer_to_bytes(obj: &Bound<'_, PyAny>) -> PyResult<Bytes> {
+    if let Ok(bytes) = obj.extract::<PyBytes>() {
+        return Ok(bytes.into_inner());
     }
 
-    Ok(dtype)
+    let py = obj.py();
+    let view = PyMemoryView::from(obj)?;
+    let bytes = if view.getattr(intern!(py, "c_contiguous"))?.is_truthy()? {
+        // Reinterpret e.g. a uint16 buffer as bytes, which is still a view of the same memory.
+        view.call_method1(intern!(py, "cast"), (intern!(py, "B"),))?
+    } else {
+        view.call_method0(intern!(py, "tobytes"))?
+    };
+    Ok(bytes.extract::<PyBytes>()?.into_inner())
+}
+
+/// The memory backing a [`PyArray`].
+enum ArrayData {
+    /// Data decoded from a TIFF tile.
+    Typed(TypedArray),
+    /// Data passed in from Python. This is a zero-copy view of the caller's buffer, which is
+    /// kept alive for as long as the array exists.
+    Bytes(Bytes),
+}
+
+impl AsRef<[u8]> for ArrayData {
+    fn as_ref(&self) -> &[u8] {
+        match self {
+            Self::Typed(data) => data.as_ref(),
+            Self::Bytes(data) => data.as_ref(),
+        }
+    }
 }
 
 /// A 3D array that implements Python's buffer protocol.
@@ -172,7 +218,7 @@ fn parse_buffer_format_string(s: &str) -> PyResult<DataType> {
 #[pyclass(name = "Array", frozen)]
 pub struct PyArray {
     /// The raw data backing the array.
-    data: TypedArray,
+    data: ArrayData,
 
     /// The shape of the array as `[dim0, dim1, dim2]`.
     ///
@@ -191,8 +237,11 @@ pub struct PyArray {
     /// - strides[2] = itemsize (bytes to skip for next element)
     strides: [isize; 3],
 
-    /// The data type of array elements.
-    data_type: DataType,
+    /// The size in bytes of one element, computed once at construction.
+    itemsize: isize,
+
+    /// The buffer protocol format string for the element type, computed once at construction.
+    format: &'static CStr,
 }
 
 impl PyArray {
@@ -201,44 +250,59 @@ impl PyArray {
         let data_type = data_type.ok_or(PyValueError::new_err(
             "Unknown data types are not currently supported.",
         ))?;
+        // Decoded tiles are always converted to native byte order.
+        Ok(Self::from_parts(
+            ArrayData::Typed(typed_data),
+            shape,
+            data_type,
+            cfg!(target_endian = "big"),
+        ))
+    }
 
+    /// Construct from contiguous data, precomputing everything `__getbuffer__` needs.
+    fn from_parts(
+        data: ArrayData,
+        shape: [usize; 3],
+        data_type: DataType,
+        big_endian: bool,
+    ) -> Self {
         let itemsize = data_type.size();
-        let shape = [shape[0] as isize, shape[1] as isize, shape[2] as isize];
         // Row-major (C-contiguous) strides: [dim1 * dim2 * itemsize, dim2 * itemsize, itemsize]
         let strides = [
-            (shape[1] as usize * shape[2] as usize * itemsize) as isize,
-            (shape[2] as usize * itemsize) as isize,
+            (shape[1] * shape[2] * itemsize) as isize,
+            (shape[2] * itemsize) as isize,
             itemsize as isize,
         ];
-        Ok(Self {
-            data: typed_data,
-            shape,
+        Self {
+            data,
+            shape: [shape[0] as isize, shape[1] as isize, shape[2] as isize],
             strides,
-            data_type,
-        })
+            itemsize: itemsize as isize,
+            format: data_type_to_buffer_format(&data_type, big_endian),
+        }
     }
 }
 
 #[pymethods]
 impl PyArray {
     #[new]
-    fn py_new(array: PyBytes, shape: [usize; 3], format: &str) -> PyResult<Self> {
-        let data_type = parse_buffer_format_string(format)?;
+    fn py_new(data: &Bound<'_, PyAny>, shape: [usize; 3], format: &str) -> PyResult<Self> {
+        let (data_type, big_endian) = parse_buffer_format_string(format)?;
         let itemsize = data_type.size();
-        let typed_data = TypedArray::try_new(array.into_inner().to_vec(), Some(data_type)).unwrap();
-        let shape = [shape[0] as isize, shape[1] as isize, shape[2] as isize];
-        // Row-major (C-contiguous) strides: [dim1 * dim2 * itemsize, dim2 * itemsize, itemsize]
-        let strides = [
-            (shape[1] as usize * shape[2] as usize * itemsize) as isize,
-            (shape[2] as usize * itemsize) as isize,
-            itemsize as isize,
-        ];
-        Ok(Self {
-            data: typed_data,
+        let data = buffer_to_bytes(data)?;
+        let expected_len = shape.iter().product::<usize>() * itemsize;
+        if data.len() != expected_len {
+            return Err(PyValueError::new_err(format!(
+                "buffer of {} bytes does not match shape {shape:?} with itemsize {itemsize}",
+                data.len()
+            )));
+        }
+        Ok(Self::from_parts(
+            ArrayData::Bytes(data),
             shape,
-            strides,
             data_type,
-        })
+            big_endian,
+        ))
     }
 
     #[getter]
@@ -291,20 +355,19 @@ impl PyArray {
         view: *mut ffi::Py_buffer,
         flags: c_int,
     ) -> PyResult<()> {
-        let itemsize = slf.data_type.size();
-
         // Fill in the Py_buffer struct fields
         // SAFETY: view is a valid pointer provided by Python's buffer protocol machinery
-        (*view).buf = data_as_ptr(&slf.data);
-        (*view).len = slf.data.len() as isize;
-        (*view).itemsize = itemsize as isize;
+        let data = slf.data.as_ref();
+        (*view).buf = data.as_ptr() as *mut std::ffi::c_void;
+        (*view).len = data.len() as isize;
+        (*view).itemsize = slf.itemsize;
         (*view).readonly = 1; // Read-only buffer
         (*view).ndim = 3;
 
         // Only provide format string if requested (PyBUF_FORMAT flag)
         (*view).format = if flags & ffi::PyBUF_FORMAT != 0 {
-            // SAFETY: data_type_to_buffer_format() returns a pointer to a static CStr
-            data_type_to_buffer_format(&slf.data_type).as_ptr() as *mut std::ffi::c_char
+            // SAFETY: format is a static CStr computed at construction
+            slf.format.as_ptr() as *mut std::ffi::c_char
         } else {
             std::ptr::null_mut()
         };
@@ -339,20 +402,3 @@ impl PyArray {
         // Nothing to clean up - all memory is owned by the PyArray struct
     }
 }
-
-fn data_as_ptr(data: &TypedArray) -> *mut std::ffi::c_void {
-    match data {
-        // Bool is 1 byte per element with 0/1 values, same memory layout as u8
-        TypedArray::Bool(data) => data.as_ptr() as _,
-        TypedArray::UInt8(data) => data.as_ptr() as _,
-        TypedArray::UInt16(data) => data.as_ptr() as _,
-        TypedArray::UInt32(data) => data.as_ptr() as _,
-        TypedArray::UInt64(data) => data.as_ptr() as _,
-        TypedArray::Int8(data) => data.as_ptr() as _,
-        TypedArray::Int16(data) => data.as_ptr() as _,
-        TypedArray::Int32(data) => data.as_ptr() as _,
-        TypedArray::Int64(data) => data.as_ptr() as _,
-        TypedArray::Float32(data) => data.as_ptr() as _,
-        TypedArray::Float64(data) => data.as_ptr() as _,
-    }
-}
@@ -12,6 +12,7 @@ use pyo3::sync::PyOnceLock;
 use pyo3::types::{PyDict, PyTuple};
 use pyo3_bytes::PyBytes;
 
+use crate::array::buffer_to_bytes;
 use crate::enums::PyCompression;
 
 static DEFAULT_DECODER_REGISTRY: PyOnceLock<Arc<DecoderRegistry>> = PyOnceLock::new();
@@ -53,10 +54,15 @@ pub(crate) struct PyDecoder(Py<PyAny>);
 
 impl PyDecoder {
     fn call(&self, py: Python, buffer: Bytes) -> PyResult<Vec<u8>> {
+        // PyBytes exposes the compressed tile to Python through the buffer protocol without
+        // copying it.
         let kwargs = PyDict::new(py);
         kwargs.set_item(intern!(py, "buffer"), PyBytes::new(buffer))?;
-        let result = self.0.call(py, PyTuple::empty(py), Some(&kwargs))?;
-        result.extract(py)
+        let result = self.0.bind(py).call(PyTuple::empty(py), Some(&kwargs))?;
+
+        // Read the result through the buffer protocol too, rather than extracting it as a
+        // sequence of Python ints, so the only copy is the final one into the owned Vec.
+        Ok(Vec::from(buffer_to_bytes(&result)?))
     }
 }
 
@@ -1,10 +1,14 @@
+use std::collections::HashMap;
+use std::sync::Mutex;
+
 use async_tiff::reader::Endianness;
 use async_tiff::tags::{
     Compression, ExtraSamples, PhotometricInterpretation, PlanarConfiguration, Predictor,
     ResolutionUnit, SampleFormat,
 };
 use pyo3::prelude::*;
-use pyo3::types::{PyString, PyTuple};
+use pyo3::sync::PyOnceLock;
+use pyo3::types::PyTuple;
 use pyo3::{intern, IntoPyObjectExt};
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
@@ -36,7 +40,7 @@ impl<'py> IntoPyObject<'py> for PyCompression {
     type Error = PyErr;
 
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
-        to_py_enum_variant(py, intern!(py, "Compression"), self.0.to_u16())
+        to_py_enum_variant(py, "Compression", self.0.to_u16())
     }
 }
 
@@ -54,13 +58,11 @@ impl<'py> IntoPyObject<'py> for PyEndianness {
     type Error = PyErr;
 
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
-        let enums_mod = py.import(intern!(py, "async_tiff.enums"))?;
-        let endianness_enum = enums_mod.getattr(intern!(py, "Endianness"))?;
-
-        match self.0 {
-            Endianness::LittleEndian => endianness_enum.getattr("LittleEndian"),
-            Endianness::BigEndian => endianness_enum.getattr("BigEndian"),
-        }
+        let value = match self.0 {
+            Endianness::LittleEndian => 0,
+            Endianness::BigEndian => 1,
+        };
+        to_py_enum_variant(py, "Endianness", value)
     }
 }
 
@@ -78,7 +80,7 @@ impl<'py> IntoPyObject<'py> for PyExtraSamples {
     type Error = PyErr;
 
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
-        to_py_enum_variant(py, intern!(py, "ExtraSamples"), self.0.to_u16())
+        to_py_enum_variant(py, "ExtraSamples", self.0.to_u16())
     }
 }
 
@@ -96,11 +98,7 @@ impl<'py> IntoPyObject<'py> for PyPhotometricInterpretation {
     type Error = PyErr;
 
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
-        to_py_enum_variant(
-            py,
-            intern!(py, "PhotometricInterpretation"),
-            self.0.to_u16(),
-        )
+        to_py_enum_variant(py, "PhotometricInterpretation", self.0.to_u16())
     }
 }
 
@@ -118,7 +116,7 @@ impl<'py> IntoPyObject<'py> for PyPlanarConfiguration {
     type Error = PyErr;
 
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
-        to_py_enum_variant(py, intern!(py, "PlanarConfiguration"), self.0.to_u16())
+        to_py_enum_variant(py, "PlanarConfiguration", self.0.to_u16())
     }
 }
 
@@ -136,7 +134,7 @@ impl<'py> IntoPyObject<'py> for PyResolutionUnit {
     type Error = PyErr;
 
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
-        to_py_enum_variant(py, intern!(py, "ResolutionUnit"), self.0.to_u16())
+        to_py_enum_variant(py, "ResolutionUnit", self.0.to_u16())
     }
 }
 
@@ -154,7 +152,7 @@ impl<'py> IntoPyObject<'py> for PyPredictor {
     type Error = PyErr;
 
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
-        to_py_enum_variant(py, intern!(py, "Predictor"), self.0.to_u16())
+        to_py_enum_variant(py, "Predictor", self.0.to_u16())
     }
 }
 
@@ -172,20 +170,45 @@ impl<'py> IntoPyObject<'py> for PySampleFormat {
     type Error = PyErr;
 
     fn into_pyobject(self, py: Python<'py>) -> Result<Self::Output, Self::Error> {
-        to_py_enum_variant(py, intern!(py, "SampleFormat"), self.0.to_u16())
+        to_py_enum_variant(py, "SampleFormat", self.0.to_u16())
     }
 }
 
+/// Python enum variants that have already been looked up, keyed by enum name and value.
+///
+/// Variants are singletons, so they can be reused instead of importing `async_tiff.enums` and
+/// calling the enum constructor on every conversion.
+static ENUM_VARIANTS: PyOnceLock<Mutex<HashMap<(&'static str, u16), Py<PyAny>>>> =
+    PyOnceLock::new();
+
 fn to_py_enum_variant<'py>(
     py: Python<'py>,
-    enum_name: &Bound<'py, PyString>,
+    enum_name: &'static str,
     value: u16,
 ) -> PyResult<Bound<'py, PyAny>> {
+    let variants = ENUM_VARIANTS.get_or_init(py, Default::default);
+    // Don't hold the lock while calling into Python below.
+    let cached = variants
+        .lock()
+        .unwrap()
+        .get(&(enum_name, value))
+        .map(|variant| variant.clone_ref(py));
+    if let Some(variant) = cached {
+        return Ok(variant.into_bound(py));
+    }
+
     let enums_mod = py.import(intern!(py, "async_tiff.enums"))?;
-    if let Ok(enum_variant) = enums_mod.call_method1(enum_name, PyTuple::new(py, vec![value])?) {
-        Ok(enum_variant)
+    let variant = if let Ok(enum_variant) =
+        enums_mod.call_method1(enum_name, PyTuple::new(py, vec![value])?)
+    {
+        enum_variant
     } else {
         // If the value is not included in the enum, return the integer itself
-        value.into_bound_py_any(py)
-    }
+        value.into_bound_py_any(py)?
+    };
+    variants
+        .lock()
+        .unwrap()
+        .insert((enum_name, value), variant.clone().unbind());
+    Ok(variant)
 }
@@ -5,6 +5,7 @@ use async_tiff::reader::AsyncFileReader;
 use async_tiff::{ImageFileDirectory, TileByteRange};
 use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::sync::PyOnceLock;
 use pyo3::IntoPyObjectExt;
 use pyo3_async_runtimes::tokio::future_into_py;
 
@@ -19,10 +20,12 @@ use crate::tile::PyTile;
 use crate::value::PyValue;
 
 #[pyclass(name = "ImageFileDirectory", frozen, eq, skip_from_py_object)]
-#[derive(Debug, Clone)]
+#[derive(Clone)]
 pub(crate) struct PyImageFileDirectory {
     ifd: Arc<ImageFileDirectory>,
     reader: Arc<dyn AsyncFileReader>,
+    /// The Python GeoKeyDirectory, built on first access and shared by every clone of this IFD.
+    geo_key_directory: Arc<PyOnceLock<Option<Py<PyGeoKeyDirectory>>>>,
 }
 
 impl PyImageFileDirectory {
@@ -30,7 +33,15 @@ impl PyImageFileDirectory {
         ifd: Arc<ImageFileDirectory>,
         reader: Arc<dyn AsyncFileReader>,
     ) -> PyImageFileDirectory {
-        PyImageFileDirectory { ifd, reader }
+        PyImageFileDirectory {
+            ifd,
+            reader,
+            geo_key_directory: Arc::new(PyOnceLock::new()),
+        }
+    }
+
+    pub(crate) fn inner(&self) -> &Arc<ImageFileDirectory> {
+        &self.ifd
     }
 }
 
@@ -231,8 +242,15 @@ impl PyImageFileDirectory {
 
     // Geospatial tags
     #[getter]
-    pub fn geo_key_directory(&self) -> Option<PyGeoKeyDirectory> {
-        self.ifd.geo_key_directory().cloned().map(|x| x.into())
+    pub fn geo_key_directory(&self, py: Python<'_>) -> PyResult<Option<Py<PyGeoKeyDirectory>>> {
+        let gkd = self.geo_key_directory.get_or_try_init(py, || {
+            self.ifd
+                .geo_key_directory()
+                .cloned()
+                .map(|gkd| Py::new(py, PyGeoKeyDirectory::from(gkd)))
+                .transpose()
+        })?;
+        Ok(gkd.as_ref().map(|gkd| gkd.clone_ref(py)))
     }
 
     #[getter]
@@ -295,7 +313,8 @@ impl PyImageFileDirectory {
             "other_tags",
         ];
 
-        // Optional keys
+        // Optional keys. Check the underlying fields rather than the Python getters, so that
+        // listing keys never clones or converts values such as the colormap.
         if self.new_subfile_type().is_some() {
             keys.push("new_subfile_type");
         }
@@ -359,7 +378,7 @@ impl PyImageFileDirectory {
         if self.tile_byte_counts().is_some() {
             keys.push("tile_byte_counts");
         }
-        if self.extra_samples().is_some() {
+        if self.ifd.extra_samples().is_some() {
             keys.push("extra_samples");
         }
         if self.jpeg_tables().is_some() {
@@ -368,7 +387,7 @@ impl PyImageFileDirectory {
         if self.copyright().is_some() {
             keys.push("copyright");
         }
-        if self.geo_key_directory().is_some() {
+        if self.ifd.geo_key_directory().is_some() {
             keys.push("geo_key_directory");
         }
         if self.model_pixel_scale().is_some() {
@@ -389,7 +408,7 @@ impl PyImageFileDirectory {
         if self.lerc_parameters().is_some() {
             keys.push("lerc_parameters");
         }
-        if self.colormap().is_some() {
+        if self.ifd.colormap().is_some() {
             keys.push("colormap");
         }
 
@@ -437,7 +456,7 @@ impl PyImageFileDirectory {
             "sample_format" => self.sample_format().into_bound_py_any(py),
             "jpeg_tables" => self.jpeg_tables().into_bound_py_any(py),
             "copyright" => self.copyright().into_bound_py_any(py),
-            "geo_key_directory" => self.geo_key_directory().into_bound_py_any(py),
+            "geo_key_directory" => self.geo_key_directory(py)?.into_bound_py_any(py),
             "model_pixel_scale" => self.model_pixel_scale().into_bound_py_any(py),
             "model_tiepoint" => self.model_tiepoint().into_bound_py_any(py),
             "model_transformation" => self.model_transformation().into_bound_py_any(py),
@@ -8,6 +8,7 @@ mod error;
 mod geo;
 mod ifd;
 mod reader;
+mod stream;
 mod thread_pool;
 mod tiff;
 mod tile;
@@ -20,6 +21,7 @@ use crate::colormap::PyColormap;
 use crate::decoder::PyDecoderRegistry;
 use crate::geo::PyGeoKeyDirectory;
 use crate::ifd::PyImageFileDirectory;
+use crate::stream::PyTileStream;
 use crate::thread_pool::PyThreadPool;
 use crate::tiff::PyTIFF;
 use crate::tile::PyTile;
@@ -62,6 +64,7 @@ fn _async_tiff(py: Python, m: &Bound<PyModule>) -> PyResult<()> {
     m.add_class::<PyThreadPool>()?;
     m.add_class::<PyTIFF>()?;
     m.add_class::<PyTile>()?;
+    m.add_class::<PyTileStream>()?;
     m.add_class::<PyArray>()?;
     m.add_class::<PyColormap>()?;
 
@@ -2,7 +2,7 @@ use std::ops::Range;
 use std::sync::Arc;
 
 use async_tiff::error::{AsyncTiffError, AsyncTiffResult};
-use async_tiff::reader::{AsyncFileReader, ObjectReader};
+use async_tiff::reader::{AsyncFileReader, CoalescingReader, ObjectReader};
 use async_trait::async_trait;
 use bytes::Bytes;
 use pyo3::exceptions::PyTypeError;
@@ -20,12 +20,28 @@ pub(crate) enum StoreInput {
 }
 
 impl StoreInput {
-    pub(crate) fn into_async_file_reader(self, path: String) -> Arc<dyn AsyncFileReader> {
+    /// Construct a reader for `path`.
+    ///
+    /// Obspec backends are wrapped in a [`CoalescingReader`] when `coalesce_window` is non-zero,
+    /// so that nearby tiles are fetched in one request. `object_store` already coalesces ranges
+    /// internally.
+    pub(crate) fn into_async_file_reader(
+        self,
+        path: String,
+        coalesce_window: u64,
+    ) -> Arc<dyn AsyncFileReader> {
         match self {
             Self::ObjectStore(store) => {
                 Arc::new(ObjectReader::new(store.into_inner(), path.into()))
             }
-            Self::ObspecBackend(backend) => Arc::new(ObspecReader { backend, path }),
+            Self::ObspecBackend(backend) => {
+                let reader = ObspecReader { backend, path };
+                if coalesce_window > 0 {
+                    Arc::new(CoalescingReader::new(reader).with_max_window_size(coalesce_window))
+                } else {
+                    Arc::new(reader)
+                }
+            }
         }
     }
 }
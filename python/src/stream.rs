@@ -0,0 +1,137 @@
+use std::sync::Arc;
+
+use async_tiff::decoder::DecoderRegistry;
+use async_tiff::error::AsyncTiffResult;
+use async_tiff::reader::AsyncFileReader;
+use async_tiff::{Array, ImageFileDirectory, Tile};
+use futures::channel::mpsc;
+use futures::lock::Mutex;
+use futures::{SinkExt, StreamExt};
+use pyo3::exceptions::{PyStopAsyncIteration, PyTypeError, PyValueError};
+use pyo3::prelude::*;
+use pyo3_async_runtimes::tokio::{future_into_py, get_runtime};
+use rayon::prelude::*;
+use rayon::ThreadPool;
+use tokio_rayon::AsyncThreadPool;
+
+use crate::array::PyArray;
+
+/// The number of tiles requested from the reader at once.
+///
+/// Each batch is a single `get_byte_ranges` call, so the reader can coalesce nearby tiles.
+const FETCH_BATCH_SIZE: usize = 8;
+
+/// The number of decoded tiles that may be buffered ahead of the consumer.
+const OUTPUT_DEPTH: usize = 8;
+
+/// An async iterator over decoded tiles.
+///
+/// Fetching and decoding run in a background task: while one batch of tiles is being decoded on
+/// the thread pool, the next batch is already being fetched. Both stages are bounded, so a slow
+/// consumer applies backpressure instead of letting decoded tiles pile up in memory.
+#[pyclass(name = "TileStream", frozen)]
+pub(crate) struct PyTileStream {
+    receiver: Arc<Mutex<mpsc::Receiver<PyResult<Array>>>>,
+}
+
+impl PyTileStream {
+    pub(crate) fn new(
+        ifd: Arc<ImageFileDirectory>,
+        reader: Arc<dyn AsyncFileReader>,
+        xy: Vec<(usize, usize)>,
+        decoder_registry: Arc<DecoderRegistry>,
+        pool: Arc<ThreadPool>,
+    ) -> Self {
+        let (fetched_tx, fetched_rx) = mpsc::channel(1);
+        let (output_tx, output_rx) = mpsc::channel(OUTPUT_DEPTH);
+
+        let runtime = get_runtime();
+        runtime.spawn(fetch_batches(ifd, reader, xy, fetched_tx));
+        runtime.spawn(decode_batches(
+            fetched_rx,
+            output_tx,
+            decoder_registry,
+            pool,
+        ));
+
+        Self {
+            receiver: Arc::new(Mutex::new(output_rx)),
+        }
+    }
+}
+
+/// Fetch tiles in batches, stopping early if the decode stage has gone away.
+async fn fetch_batches(
+    ifd: Arc<ImageFileDirectory>,
+    reader: Arc<dyn AsyncFileReader>,
+    xy: Vec<(usize, usize)>,
+    mut fetched_tx: mpsc::Sender<PyResult<Vec<Tile>>>,
+) {
+    for batch in xy.chunks(FETCH_BATCH_SIZE) {
+        let tiles = ifd
+            .fetch_tiles(batch, reader.as_ref())
+            .await
+            .map_err(|err| PyTypeError::new_err(err.to_string()));
+        let failed = tiles.is_err();
+        if fetched_tx.send(tiles).await.is_err() || failed {
+            return;
+        }
+    }
+}
+
+/// Decode each fetched batch on the thread pool and forward the arrays in order.
+async fn decode_batches(
+    mut fetched_rx: mpsc::Receiver<PyResult<Vec<Tile>>>,
+    mut output_tx: mpsc::Sender<PyResult<Array>>,
+    decoder_registry: Arc<DecoderRegistry>,
+    pool: Arc<ThreadPool>,
+) {
+    while let Some(tiles) = fetched_rx.next().await {
+        let arrays = match tiles {
+            Ok(tiles) => {
+                let decoder_registry = decoder_registry.clone();
+                pool.spawn_fifo_async(move || {
+                    tiles
+                        .into_par_iter()
+                        .map(|tile| tile.decode(&decoder_registry))
+                        .collect::<AsyncTiffResult<Vec<_>>>()
+                })
+                .await
+                .map_err(|err| PyValueError::new_err(err.to_string()))
+            }
+            Err(err) => Err(err),
+        };
+
+        match arrays {
+            Ok(arrays) => {
+                for array in arrays {
+                    if output_tx.send(Ok(array)).await.is_err() {
+                        return;
+                    }
+                }
+            }
+            Err(err) => {
+                let _ = output_tx.send(Err(err)).await;
+                return;
+            }
+        }
+    }
+}
+
+#[pymethods]
+impl PyTileStream {
+    fn __aiter__(slf: Py<Self>) -> Py<Self> {
+        slf
+    }
+
+    fn __anext__<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let receiver = self.receiver.clone();
+        future_into_py(py, async move {
+            let next = receiver.lock().await.next().await;
+            match next {
+                Some(array) => Ok(PyArray::try_new(array?)?),
+                None => Err(PyStopAsyncIteration::new_err(())),
+            }
+        })
+    }
+}
@@ -1,24 +1,31 @@
+use std::collections::HashSet;
 use std::sync::Arc;
 
+use async_tiff::error::AsyncTiffResult;
 use async_tiff::metadata::cache::ReadaheadMetadataCache;
 use async_tiff::metadata::TiffMetadataReader;
 use async_tiff::reader::{AsyncFileReader, Endianness};
-use async_tiff::ImageFileDirectory;
-use pyo3::exceptions::{PyIndexError, PyTypeError};
+use pyo3::exceptions::{PyIndexError, PyTypeError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::PyType;
 use pyo3_async_runtimes::tokio::future_into_py;
+use rayon::prelude::*;
+use tokio_rayon::AsyncThreadPool;
 
+use crate::array::PyArray;
+use crate::decoder::{get_default_decoder_registry, PyDecoderRegistry};
 use crate::enums::PyEndianness;
 use crate::error::PyAsyncTiffResult;
 use crate::reader::StoreInput;
+use crate::stream::PyTileStream;
+use crate::thread_pool::{get_default_pool, PyThreadPool};
 use crate::tile::PyTile;
 use crate::PyImageFileDirectory;
 
 #[pyclass(name = "TIFF", frozen, subclass)]
 pub(crate) struct PyTIFF {
     endianness: Endianness,
-    ifds: Vec<Arc<ImageFileDirectory>>,
+    ifds: Vec<PyImageFileDirectory>,
     reader: Arc<dyn AsyncFileReader>,
 }
 
@@ -34,7 +41,10 @@ async fn open(
     let ifds = metadata_reader.read_all_ifds(&metadata_fetch).await?;
     Ok(PyTIFF {
         endianness: metadata_reader.endianness(),
-        ifds: ifds.into_iter().map(Arc::new).collect(),
+        ifds: ifds
+            .into_iter()
+            .map(|ifd| PyImageFileDirectory::new(Arc::new(ifd), reader.clone()))
+            .collect(),
         reader,
     })
 }
@@ -42,7 +52,7 @@ async fn open(
 #[pymethods]
 impl PyTIFF {
     #[classmethod]
-    #[pyo3(signature = (path, *, store, prefetch=32768, multiplier=2.0))]
+    #[pyo3(signature = (path, *, store, prefetch=32768, multiplier=2.0, coalesce_window=16*1024*1024))]
     fn open<'py>(
         _cls: &Bound<'py, PyType>,
         py: Python<'py>,
@@ -50,8 +60,9 @@ impl PyTIFF {
         store: StoreInput,
         prefetch: u64,
         multiplier: f64,
+        coalesce_window: u64,
     ) -> PyResult<Bound<'py, PyAny>> {
-        let reader = store.into_async_file_reader(path);
+        let reader = store.into_async_file_reader(path, coalesce_window);
 
         let cog_reader =
             future_into_py(
@@ -71,6 +82,7 @@ impl PyTIFF {
         self.ifds
             .iter()
             .flat_map(|ifd| {
+                let ifd = ifd.inner();
                 ifd.tile_offsets()
                     .into_iter()
                     .chain(ifd.strip_offsets())
@@ -83,20 +95,16 @@ impl PyTIFF {
     }
 
     fn ifd(&self, index: usize) -> PyResult<PyImageFileDirectory> {
-        let ifd = self
-            .ifds
+        self.ifds
             .get(index)
-            .ok_or_else(|| PyIndexError::new_err(format!("No IFD found for index={index}")))?
-            .clone();
-        Ok(PyImageFileDirectory::new(ifd, self.reader.clone()))
+            .cloned()
+            .ok_or_else(|| PyIndexError::new_err(format!("No IFD found for index={index}")))
     }
 
     #[getter]
     fn ifds(&self) -> Vec<PyImageFileDirectory> {
-        self.ifds
-            .iter()
-            .map(|ifd| PyImageFileDirectory::new(ifd.clone(), self.reader.clone()))
-            .collect()
+        // Clones share their lazily-built Python values, such as the GeoKeyDirectory.
+        self.ifds.clone()
     }
 
     fn fetch_tile<'py>(
@@ -111,6 +119,7 @@ impl PyTIFF {
             .ifds
             .get(z)
             .ok_or_else(|| PyIndexError::new_err(format!("No IFD found for z={z}")))?
+            .inner()
             .clone();
         future_into_py(py, async move {
             let tile = ifd
@@ -133,6 +142,7 @@ impl PyTIFF {
             .ifds
             .get(z)
             .ok_or_else(|| PyIndexError::new_err(format!("No IFD found for z={z}")))?
+            .inner()
             .clone();
         future_into_py(py, async move {
             let tiles = ifd
@@ -143,4 +153,94 @@ impl PyTIFF {
             Ok(py_tiles)
         })
     }
+
+    #[pyo3(signature = (xy, z, *, decoder_registry=None, pool=None))]
+    fn stream_tiles(
+        &self,
+        py: Python<'_>,
+        xy: Vec<(usize, usize)>,
+        z: usize,
+        decoder_registry: Option<&PyDecoderRegistry>,
+        pool: Option<&PyThreadPool>,
+    ) -> PyResult<PyTileStream> {
+        let decoder_registry = decoder_registry
+            .map(|r| r.inner().clone())
+            .unwrap_or_else(|| get_default_decoder_registry(py));
+        let pool = pool
+            .map(|p| Ok(p.inner().clone()))
+            .unwrap_or_else(|| get_default_pool(py))?;
+        let ifd = self
+            .ifds
+            .get(z)
+            .ok_or_else(|| PyIndexError::new_err(format!("No IFD found for z={z}")))?
+            .inner()
+            .clone();
+        Ok(PyTileStream::new(
+            ifd,
+            self.reader.clone(),
+            xy,
+            decoder_registry,
+            pool,
+        ))
+    }
+
+    #[pyo3(signature = (tiles, *, decoder_registry=None, pool=None))]
+    fn decode_tiles<'py>(
+        &self,
+        py: Python<'py>,
+        tiles: Vec<Bound<'py, PyTile>>,
+        decoder_registry: Option<&PyDecoderRegistry>,
+        pool: Option<&PyThreadPool>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        let decoder_registry = decoder_registry
+            .map(|r| r.inner().clone())
+            .unwrap_or_else(|| get_default_decoder_registry(py));
+        let pool = pool
+            .map(|p| Ok(p.inner().clone()))
+            .unwrap_or_else(|| get_default_pool(py))?;
+
+        // Borrow and validate the whole batch before taking anything, so that an error leaves
+        // every tile usable. The borrows are held until every tile has been taken, so nothing
+        // else can consume a tile in between.
+        let mut seen = HashSet::with_capacity(tiles.len());
+        let mut borrowed = Vec::with_capacity(tiles.len());
+        for tile in &tiles {
+            if !seen.insert(tile.as_ptr()) {
+                return Err(PyValueError::new_err(
+                    "The same tile was passed more than once",
+                ));
+            }
+            let tile = tile
+                .try_borrow_mut()
+                .map_err(|_| PyValueError::new_err("Tile is already in use"))?;
+            if tile.is_consumed() {
+                return Err(PyValueError::new_err("Tile has been consumed"));
+            }
+            borrowed.push(tile);
+        }
+        let tiles = borrowed
+            .iter_mut()
+            .map(|tile| tile.take())
+            .collect::<PyResult<Vec<_>>>()?;
+        drop(borrowed);
+
+        future_into_py(py, async move {
+            // The whole batch is a single job on the pool, so the parallel iterator below fans
+            // out across that pool's threads. No GIL is held while decoding.
+            let arrays = pool
+                .spawn_fifo_async(move || {
+                    tiles
+                        .into_par_iter()
+                        .map(|tile| tile.decode(&decoder_registry))
+                        .collect::<AsyncTiffResult<Vec<_>>>()
+                })
+                .await
+                .map_err(|e| PyValueError::new_err(e.to_string()))?;
+            let py_arrays = arrays
+                .into_iter()
+                .map(PyArray::try_new)
+                .collect::<PyAsyncTiffResult<Vec<_>>>()?;
+            Ok(py_arrays)
+        })
+    }
 }
@@ -19,6 +19,18 @@ impl PyTile {
     pub(crate) fn new(tile: Tile) -> Self {
         Self(Some(tile))
     }
+
+    /// Whether the underlying tile has already been taken.
+    pub(crate) fn is_consumed(&self) -> bool {
+        self.0.is_none()
+    }
+
+    /// Take ownership of the underlying tile, marking this Python object as consumed.
+    pub(crate) fn take(&mut self) -> PyResult<Tile> {
+        self.0
+            .take()
+            .ok_or(PyValueError::new_err("Tile has been consumed"))
+    }
 }
 
 #[pymethods]
@@ -64,11 +76,10 @@ impl PyTile {
         let decoder_registry = decoder_registry
             .map(|r| r.inner().clone())
             .unwrap_or_else(|| get_default_decoder_registry(py));
-        let tile = self
-            .0
-            .take()
-            .ok_or(PyValueError::new_err("Tile has been consumed"))?;
-        let array = tile.decode(&decoder_registry)?;
+        let tile = self.take()?;
+        // Release the GIL while decompressing. Rust-native decoders never touch the interpreter;
+        // a custom Python decoder re-acquires the GIL only for the duration of its own callback.
+        let array = py.detach(|| tile.decode(&decoder_registry))?;
         PyArray::try_new(array)
     }
 
@@ -85,10 +96,7 @@ impl PyTile {
         let pool = pool
             .map(|p| Ok(p.inner().clone()))
             .unwrap_or_else(|| get_default_pool(py))?;
-        let tile = self
-            .0
-            .take()
-            .ok_or(PyValueError::new_err("Tile has been consumed"))?;
+        let tile = self.take()?;
 
         future_into_py(py, async move {
             let array = pool
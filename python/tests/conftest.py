@@ -51,9 +51,17 @@ def fixture_store(fixtures_dir) -> LocalStore:
     return LocalStore(fixtures_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def load_tiff(fixture_store):
+    # A TIFF is immutable once opened, so a single handle per file can be shared across
+    # the whole session instead of re-reading its metadata in every test.
+    cache: dict[tuple[str, str], TIFF] = {}
+
     async def _load(name: str, *, variant: str) -> TIFF:
+        key = (name, variant)
+        if key in cache:
+            return cache[key]
+
         path = "geotiff-test-data/"
 
         if variant == "rasterio":
@@ -62,7 +70,8 @@ def load_tiff(fixture_store):
             path += f"real_data/{variant}/"
 
         path = f"{path}{name}.tif"
-        return await TIFF.open(path=path, store=fixture_store)
+        cache[key] = await TIFF.open(path=path, store=fixture_store)
+        return cache[key]
 
     return _load
 
@@ -6,33 +6,93 @@ from async_tiff.enums import PhotometricInterpretation
 from .utils import load_tiff
 
 
+ROUND_TRIP_FORMATS = [
+    (np.uint8, "<B"),
+    (np.uint16, "<H"),
+    (np.uint32, "<I"),
+    (np.uint64, "<Q"),
+    (np.int8, "<b"),
+    (np.int16, "<h"),
+    (np.int32, "<i"),
+    (np.int64, "<q"),
+    (np.float32, "<f"),
+    (np.float64, "<d"),
+    # Non-native byte order must be preserved, not reinterpreted as native.
+    (np.dtype(">u2"), ">H"),
+    (np.dtype(">f8"), ">d"),
+]
+
+# Built once at import time, so the test itself only exercises Array and the buffer protocol.
+ROUND_TRIP_CASES = [
+    (np.array([[[1, 2, 3], [4, 5, 6]]], dtype=dtype), format_str)
+    for dtype, format_str in ROUND_TRIP_FORMATS
+]
+
+
+def _data_pointer(arr: np.ndarray) -> int:
+    return arr.__array_interface__["data"][0]
+
+
+def test_round_trip():
+    """Test zero-copy round-trip conversion for all supported dtypes."""
+    for np_array, format_str in ROUND_TRIP_CASES:
+        assert np_array.shape == (1, 2, 3)
+
+        rust_array = Array(np_array, shape=np_array.shape, format=format_str)
+
+        np_view = np.asarray(rust_array)
+        assert np_view.shape == np_array.shape
+        assert np_view.dtype == np_array.dtype
+        assert np.array_equal(np_array, np_view)
+        # Both conversions are views, so the result must share the input's memory.
+        assert _data_pointer(np_view) == _data_pointer(np_array), format_str
+
+
+def test_from_numpy_buffer():
+    np_array = np.arange(24, dtype=np.uint16).reshape(2, 3, 4)
+
+    rust_array = Array(np_array, shape=np_array.shape, format="<H")
+    np.testing.assert_array_equal(np.asarray(rust_array), np_array)
+
+
+def test_from_non_contiguous_buffer():
+    base = np.arange(48, dtype=np.float32).reshape(2, 6, 4)
+    np_array = base[:, ::2, :]
+    assert not np_array.flags.c_contiguous
+
+    rust_array = Array(np_array, shape=np_array.shape, format="<f")
+    np.testing.assert_array_equal(np.asarray(rust_array), np_array)
+
+
 @pytest.mark.parametrize(
-    "dtype,format_str",
+    "format_str,message",
     [
-        (np.uint8, "<B"),
-        (np.uint16, "<H"),
-        (np.uint32, "<I"),
-        (np.uint64, "<Q"),
-        (np.int8, "<b"),
-        (np.int16, "<h"),
-        (np.int32, "<i"),
-        (np.int64, "<q"),
-        (np.float32, "<f"),
-        (np.float64, "<d"),
+        ("", "empty format string"),
+        ("<", "missing type character"),
+        ("<x", "invalid type character"),
+        ("<BB", "unexpected characters"),
     ],
 )
-def test_round_trip(dtype, format_str):
-    """Test round-trip conversion for all supported dtypes."""
-    np_array = np.array([[[1, 2, 3], [4, 5, 6]]], dtype=dtype)
-    assert np_array.shape == (1, 2, 3)
-
-    shape = np_array.shape[0], np_array.shape[1], np_array.shape[2]
-    rust_array = Array(np_array.tobytes(), shape=shape, format=format_str)
-
-    np_view = np.asarray(rust_array)
-    assert np_view.shape == np_array.shape
-    assert np_view.dtype == np_array.dtype
-    assert np.array_equal(np_array, np_view)
+def test_invalid_format(format_str, message):
+    with pytest.raises(ValueError, match=message):
+        Array(bytes(6), shape=(1, 2, 3), format=format_str)
+
+
+def test_buffer_length_mismatch():
+    with pytest.raises(ValueError, match="does not match shape"):
+        Array(bytes(5), shape=(1, 2, 3), format="<B")
+
+    with pytest.raises(ValueError, match="does not match shape"):
+        Array(bytes(6), shape=(1, 2, 3), format="<H")
+
+
+def test_buffer_byte_length():
+    np_array = np.arange(6, dtype=np.uint16).reshape(1, 2, 3)
+    rust_array = Array(np_array.tobytes(), shape=(1, 2, 3), format="<H")
+
+    view = memoryview(rust_array)
+    assert view.nbytes == np_array.nbytes
+    assert view.tobytes() == np_array.tobytes()
 
 
 async def test_loading_bitmask():
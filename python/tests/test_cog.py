@@ -3,6 +3,8 @@ import pytest
 from async_tiff import TIFF, enums
 from async_tiff.store import LocalStore, S3Store
 
+SENTINEL_COGS_STORE = S3Store("sentinel-cogs", region="us-west-2", skip_signature=True)
+
 
 async def test_cog_s3():
     """
@@ -10,8 +12,7 @@ async def test_cog_s3():
     s3 bucket, read IFDs and GeoKeyDirectory metadata.
     """
     path = "sentinel-s2-l2a-cogs/12/S/UF/2022/6/S2B_12SUF_20220609_0_L2A/B04.tif"
-    store = S3Store("sentinel-cogs", region="us-west-2", skip_signature=True)
-    tiff = await TIFF.open(path=path, store=store)
+    tiff = await TIFF.open(path=path, store=SENTINEL_COGS_STORE)
 
     assert tiff.endianness == enums.Endianness.LittleEndian
 
@@ -42,3 +42,15 @@ async def test_ifd_dict():
         "geog_inv_flattening": 298.257222101004,
     }
     assert dict(gkd) == expected_gkd
+
+
+async def test_ifd_values_are_reused():
+    filename = "other/geogtowgs_subset_USGS_13_s14w171.tif"
+    tiff = await load_tiff(filename)
+
+    gkd = tiff.ifds[0].geo_key_directory
+    assert gkd is not None
+    assert tiff.ifds[0].geo_key_directory is gkd
+    assert tiff.ifd(0)["geo_key_directory"] is gkd
+
+    assert tiff.ifds[0].compression is Compression.Deflate
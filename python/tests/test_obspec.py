@@ -72,3 +72,53 @@ async def test_read_with_obspec():
     filename = "other/geogtowgs_subset_USGS_13_s14w171.tif"
     tiff = await TIFF.open(path=filename, store=wrapper)
     assert len(tiff.ifds) > 0
+
+
+class RecordingWrapper(ObstoreWrapper):
+    """An obspec backend that records the ranges passed to `get_ranges_async`."""
+
+    def __init__(self, store: LocalStore):
+        super().__init__(store)
+        self.requested_starts: list[list[int]] = []
+
+    async def get_ranges_async(
+        self,
+        path: str,
+        *,
+        starts: Sequence[int],
+        ends: Sequence[int] | None = None,
+        lengths: Sequence[int] | None = None,
+    ) -> Sequence[Buffer]:
+        self.requested_starts.append(list(starts))
+        return await super().get_ranges_async(
+            path,
+            starts=starts,
+            ends=ends,
+            lengths=lengths,
+        )
+
+
+@pytest.mark.asyncio
+async def test_fetch_tiles_coalesced_with_obspec():
+    store = LocalStore(FIXTURES_DIR)
+    # 374x499 with 32x32 tiles, whose data is written back to back.
+    filename = "image-tiff/tiled-rgb-u8.tif"
+
+    coalesced = RecordingWrapper(store)
+    uncoalesced = RecordingWrapper(store)
+    tiff = await TIFF.open(path=filename, store=coalesced)
+    uncoalesced_tiff = await TIFF.open(path=filename, store=uncoalesced, coalesce_window=0)
+
+    ifd = tiff.ifds[0]
+    tiles_across = -(-ifd.image_width // ifd.tile_width)
+    assert tiles_across >= 4
+    xy = [(x, 0) for x in range(4)]
+
+    tiles = await tiff.fetch_tiles(xy, 0)
+    expected = await uncoalesced_tiff.fetch_tiles(xy, 0)
+    for tile, expected_tile in zip(tiles, expected):
+        assert bytes(tile.compressed_bytes) == bytes(expected_tile.compressed_bytes)
+
+    assert len(uncoalesced.requested_starts[-1]) == len(xy)
+    # Adjacent tiles in a row are merged into a single request.
+    assert len(coalesced.requested_starts[-1]) == 1
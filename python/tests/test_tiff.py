@@ -53,3 +53,72 @@ async def test_header_byte_size(
         if offset != 0
     )
     assert header == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("variant", "file_name"), [("eox", "eox_cloudless")])
+async def test_decode_tiles(
+    load_tiff: LoadTIFF,
+    variant: str,
+    file_name: str,
+) -> None:
+    tiff = await load_tiff(file_name, variant=variant)
+    ifd = tiff.ifds[0]
+    tiles_across = -(-ifd.image_width // ifd.tile_width)
+    tiles_down = -(-ifd.image_height // ifd.tile_height)
+    xy = [(x, y) for y in range(min(tiles_down, 2)) for x in range(min(tiles_across, 2))]
+
+    tiles = await tiff.fetch_tiles(xy, 0)
+    arrays = await tiff.decode_tiles(tiles)
+    assert len(arrays) == len(xy)
+
+    for (x, y), array in zip(xy, arrays):
+        tile = await tiff.fetch_tile(x, y, 0)
+        expected = await tile.decode()
+        np.testing.assert_array_equal(np.asarray(array), np.asarray(expected))
+
+    with pytest.raises(ValueError, match="consumed"):
+        await tiff.decode_tiles(tiles)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("variant", "file_name"), [("eox", "eox_cloudless")])
+async def test_decode_tiles_leaves_batch_intact_on_error(
+    load_tiff: LoadTIFF,
+    variant: str,
+    file_name: str,
+) -> None:
+    tiff = await load_tiff(file_name, variant=variant)
+    fresh, consumed = await tiff.fetch_tiles([(0, 0), (0, 0)], 0)
+    await consumed.decode()
+
+    with pytest.raises(ValueError, match="consumed"):
+        await tiff.decode_tiles([fresh, consumed])
+
+    with pytest.raises(ValueError, match="more than once"):
+        await tiff.decode_tiles([fresh, fresh])
+
+    # Neither failed call took the fresh tile.
+    arrays = await tiff.decode_tiles([fresh])
+    assert len(arrays) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("variant", "file_name"), [("eox", "eox_cloudless")])
+async def test_stream_tiles(
+    load_tiff: LoadTIFF,
+    variant: str,
+    file_name: str,
+) -> None:
+    tiff = await load_tiff(file_name, variant=variant)
+    ifd = tiff.ifds[0]
+    tiles_across = -(-ifd.image_width // ifd.tile_width)
+    tiles_down = -(-ifd.image_height // ifd.tile_height)
+    xy = [(x, y) for y in range(min(tiles_down, 3)) for x in range(min(tiles_across, 4))]
+
+    arrays = [array async for array in tiff.stream_tiles(xy, 0)]
+    assert len(arrays) == len(xy)
+
+    expected = await tiff.decode_tiles(await tiff.fetch_tiles(xy, 0))
+    for array, expected_array in zip(arrays, expected):
+        np.testing.assert_array_equal(np.asarray(array), np.asarray(expected_array))
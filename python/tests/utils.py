@@ -5,8 +5,13 @@ from async_tiff.store import LocalStore
 
 FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures"
 
+_STORE = LocalStore(FIXTURES_DIR)
+
+# Opened TIFFs are immutable, so they are shared between tests.
+_TIFF_CACHE: dict[str, TIFF] = {}
+
 
 async def load_tiff(filename: str):
-    store = LocalStore(FIXTURES_DIR)
-    tiff = await TIFF.open(path=filename, store=store)
-    return tiff
+    if filename not in _TIFF_CACHE:
+        _TIFF_CACHE[filename] = await TIFF.open(path=filename, store=_STORE)
+    return _TIFF_CACHE[filename]
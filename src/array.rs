@@ -330,16 +330,55 @@ impl AsRef<[u8]> for TypedArray {
     }
 }
 
+/// The expansion of every possible byte into 8 bytes of 0 or 1, most significant bit first.
+const BITMASK_LUT: [[u8; 8]; 256] = {
+    let mut lut = [[0u8; 8]; 256];
+    let mut byte = 0;
+    while byte < 256 {
+        let mut bit = 0;
+        while bit < 8 {
+            lut[byte][bit] = ((byte >> (7 - bit)) & 1) as u8;
+            bit += 1;
+        }
+        byte += 1;
+    }
+    lut
+};
+
 /// Expands a packed bitmask to `Vec<bool>`.
 ///
 /// Per TIFF spec, 1 = valid pixel, 0 = transparent/masked pixel.
 fn expand_bitmask(data: &[u8], len: usize) -> Vec<bool> {
-    let mut result = Vec::with_capacity(len);
-    for i in 0..len {
-        let byte_idx = i / 8;
-        let bit_idx = 7 - (i % 8); // MSB first within each byte
-        let bit = (data[byte_idx] >> bit_idx) & 1;
-        result.push(bit == 1);
+    let mut result = vec![0u8; len];
+
+    // Whole bytes are expanded 8 pixels at a time through a lookup table, which is branch-free
+    // and fast on every target.
+    let mut chunks = result.chunks_exact_mut(8);
+    for (byte, chunk) in data.iter().zip(&mut chunks) {
+        chunk.copy_from_slice(&BITMASK_LUT[*byte as usize]);
+    }
+    let tail = chunks.into_remainder();
+    if !tail.is_empty() {
+        let last = &BITMASK_LUT[data[len / 8] as usize];
+        tail.copy_from_slice(&last[..tail.len()]);
+    }
+
+    // u8 and bool have the same layout, so this collects in place without reallocating.
+    result.into_iter().map(|bit| bit == 1).collect()
+}
+
+#[cfg(test)]
+mod test {
+    use super::*;
+
+    #[test]
+    fn test_expand_bitmask() {
+        let data = (0..=255u8).rev().chain([0b1010_0000]).collect::<Vec<_>>();
+        for len in [0, 1, 7, 8, 9, 63, 64, 100, 256 * 8, 256 * 8 + 3] {
+            let expected = (0..len)
+                .map(|i| (data[i / 8] >> (7 - (i % 8))) & 1 == 1)
+                .collect::<Vec<_>>();
+            assert_eq!(expand_bitmask(&data, len), expected, "len={len}");
+        }
     }
-    result
 }
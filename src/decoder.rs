@@ -79,6 +79,35 @@ pub trait Decoder: Debug + Send + Sync {
         bits_per_sample: u16,
         lerc_parameters: Option<&[u32]>,
     ) -> AsyncTiffResult<Vec<u8>>;
+
+    /// Decode a TIFF tile whose decoded size in bytes is expected to be `decoded_size`.
+    ///
+    /// The size is derived from the tile dimensions, samples per pixel and bits per sample, and
+    /// allows decoders to allocate their output buffer once up front. It is only a hint: a
+    /// malformed file may decode to a different size, so implementations must not rely on it for
+    /// correctness.
+    ///
+    /// The default implementation ignores the hint and calls [`decode_tile`][Self::decode_tile].
+    #[allow(clippy::too_many_arguments)]
+    fn decode_tile_with_size_hint(
+        &self,
+        buffer: Bytes,
+        photometric_interpretation: PhotometricInterpretation,
+        jpeg_tables: Option<&[u8]>,
+        samples_per_pixel: u16,
+        bits_per_sample: u16,
+        lerc_parameters: Option<&[u32]>,
+        _decoded_size: usize,
+    ) -> AsyncTiffResult<Vec<u8>> {
+        self.decode_tile(
+            buffer,
+            photometric_interpretation,
+            jpeg_tables,
+            samples_per_pixel,
+            bits_per_sample,
+            lerc_parameters,
+        )
+    }
 }
 
 /// A decoder for the Deflate compression method.
@@ -100,6 +129,52 @@ impl Decoder for DeflateDecoder {
         decoder.read_to_end(&mut buf)?;
         Ok(buf)
     }
+
+    /// With the `libdeflate` feature enabled, decompress in one shot into a buffer of exactly
+    /// `decoded_size` bytes using libdeflate, which is considerably faster than the streaming
+    /// zlib implementation. Falls back to streaming decompression if the data turns out to be
+    /// larger than expected.
+    #[cfg(feature = "libdeflate")]
+    fn decode_tile_with_size_hint(
+        &self,
+        buffer: Bytes,
+        photometric_interpretation: PhotometricInterpretation,
+        jpeg_tables: Option<&[u8]>,
+        samples_per_pixel: u16,
+        bits_per_sample: u16,
+        lerc_parameters: Option<&[u32]>,
+        decoded_size: usize,
+    ) -> AsyncTiffResult<Vec<u8>> {
+        use std::cell::RefCell;
+
+        use libdeflater::{DecompressionError, Decompressor};
+
+        thread_local! {
+            // Decompressors are cheap to reuse but not to allocate, so keep one per thread.
+            static DECOMPRESSOR: RefCell<Decompressor> = RefCell::new(Decompressor::new());
+        }
+
+        let mut out = vec![0; decoded_size];
+        let result = DECOMPRESSOR
+            .with_borrow_mut(|decompressor| decompressor.zlib_decompress(&buffer, &mut out));
+        match result {
+            Ok(len) => {
+                out.truncate(len);
+                Ok(out)
+            }
+            Err(DecompressionError::InsufficientSpace) => self.decode_tile(
+                buffer,
+                photometric_interpretation,
+                jpeg_tables,
+                samples_per_pixel,
+                bits_per_sample,
+                lerc_parameters,
+            ),
+            Err(err) => Err(AsyncTiffError::General(format!(
+                "Deflate decompression failed: {err}"
+            ))),
+        }
+    }
 }
 
 /// A decoder for the JPEG compression method.
@@ -238,11 +313,35 @@ impl Decoder for LZWDecoder {
         _bits_per_sample: u16,
         _lerc_parameters: Option<&[u32]>,
     ) -> AsyncTiffResult<Vec<u8>> {
-        // https://github.com/image-rs/image-tiff/blob/90ae5b8e54356a35e266fb24e969aafbcb26e990/src/decoder/stream.rs#L147
-        let mut decoder = weezl::decode::Decoder::with_tiff_size_switch(weezl::BitOrder::Msb, 8);
-        let decoded = decoder.decode(&buffer).expect("failed to decode LZW data");
-        Ok(decoded)
+        decode_lzw(&buffer, Vec::new())
     }
+
+    /// Decode into a buffer preallocated to `decoded_size`, so that the output is not
+    /// repeatedly reallocated as it grows.
+    fn decode_tile_with_size_hint(
+        &self,
+        buffer: Bytes,
+        _photometric_interpretation: PhotometricInterpretation,
+        _jpeg_tables: Option<&[u8]>,
+        _samples_per_pixel: u16,
+        _bits_per_sample: u16,
+        _lerc_parameters: Option<&[u32]>,
+        decoded_size: usize,
+    ) -> AsyncTiffResult<Vec<u8>> {
+        decode_lzw(&buffer, Vec::with_capacity(decoded_size))
+    }
+}
+
+/// Decode a full LZW stream, appending the output to `out`.
+fn decode_lzw(buffer: &[u8], mut out: Vec<u8>) -> AsyncTiffResult<Vec<u8>> {
+    // https://github.com/image-rs/image-tiff/blob/90ae5b8e54356a35e266fb24e969aafbcb26e990/src/decoder/stream.rs#L147
+    let mut decoder = weezl::decode::Decoder::with_tiff_size_switch(weezl::BitOrder::Msb, 8);
+    decoder
+        .into_vec(&mut out)
+        .decode_all(buffer)
+        .status
+        .map_err(|err| AsyncTiffError::General(format!("LZW decompression failed: {err}")))?;
+    Ok(out)
 }
 
 /// A decoder for the JPEG2000 compression method.
@@ -409,3 +508,56 @@ fn decode_modern_jpeg(
     let data = decoder.decode()?;
     Ok(data)
 }
+
+#[cfg(test)]
+mod test {
+    use super::*;
+
+    fn encode_lzw(data: &[u8]) -> Bytes {
+        let mut encoder = weezl::encode::Encoder::with_tiff_size_switch(weezl::BitOrder::Msb, 8);
+        Bytes::from(encoder.encode(data).unwrap())
+    }
+
+    fn decode(buffer: Bytes, decoded_size: Option<usize>) -> AsyncTiffResult<Vec<u8>> {
+        let photometric_interpretation = PhotometricInterpretation::BlackIsZero;
+        match decoded_size {
+            Some(decoded_size) => LZWDecoder.decode_tile_with_size_hint(
+                buffer,
+                photometric_interpretation,
+                None,
+                1,
+                8,
+                None,
+                decoded_size,
+            ),
+            None => LZWDecoder.decode_tile(buffer, photometric_interpretation, None, 1, 8, None),
+        }
+    }
+
+    #[test]
+    fn test_lzw_size_hint_matches_decode_tile() {
+        let data = (0..4096u32)
+            .map(|i| (i * 7 % 251) as u8)
+            .collect::<Vec<_>>();
+        let encoded = encode_lzw(&data);
+
+        let expected = decode(encoded.clone(), None).unwrap();
+        assert_eq!(expected, data);
+        // The hint only sizes the allocation, so a wrong hint must not change the output.
+        for decoded_size in [data.len(), 0, data.len() / 2, data.len() * 2] {
+            assert_eq!(
+                decode(encoded.clone(), Some(decoded_size)).unwrap(),
+                expected,
+                "decoded_size={decoded_size}"
+            );
+        }
+    }
+
+    #[test]
+    fn test_lzw_invalid_stream_is_error() {
+        // The first 9-bit code is 511, which is not yet in the code table.
+        let garbage = Bytes::from_static(&[0xFF; 16]);
+        assert!(decode(garbage.clone(), None).is_err());
+        assert!(decode(garbage, Some(1024)).is_err());
+    }
+}
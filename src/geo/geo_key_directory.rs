@@ -1,11 +1,9 @@
 #![allow(dead_code)]
 #![allow(missing_docs)]
 
-use std::collections::HashMap;
-
 use num_enum::{IntoPrimitive, TryFromPrimitive};
 
-use crate::error::{TiffError, TiffResult};
+use crate::error::TiffResult;
 use crate::tag_value::TagValue;
 
 /// Geospatial TIFF tag variants
@@ -69,7 +67,7 @@ pub(crate) enum GeoKeyTag {
 /// Metadata defined by the GeoTIFF standard.
 ///
 /// <http://docs.opengeospatial.org/is/19-008r4/19-008r4.html#_requirements_class_geokeydirectorytag>
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, Default, PartialEq)]
 pub struct GeoKeyDirectory {
     pub model_type: Option<u16>,
     pub raster_type: Option<u16>,
@@ -134,168 +132,69 @@ pub struct GeoKeyDirectory {
 }
 
 impl GeoKeyDirectory {
-    /// Construct a new [`GeoKeyDirectory`] from tag values.
-    pub(crate) fn from_tags(mut tag_data: HashMap<GeoKeyTag, TagValue>) -> TiffResult<Self> {
-        let mut model_type = None;
-        let mut raster_type = None;
-        let mut citation = None;
-
-        let mut geographic_type = None;
-        let mut geog_citation = None;
-        let mut geog_geodetic_datum = None;
-        let mut geog_prime_meridian = None;
-        let mut geog_linear_units = None;
-        let mut geog_linear_unit_size = None;
-        let mut geog_angular_units = None;
-        let mut geog_angular_unit_size = None;
-        let mut geog_ellipsoid = None;
-        let mut geog_semi_major_axis = None;
-        let mut geog_semi_minor_axis = None;
-        let mut geog_inv_flattening = None;
-        let mut geog_azimuth_units = None;
-        let mut geog_prime_meridian_long = None;
-
-        let mut projected_type = None;
-        let mut proj_citation = None;
-        let mut projection = None;
-        let mut proj_coord_trans = None;
-        let mut proj_linear_units = None;
-        let mut proj_linear_unit_size = None;
-        let mut proj_std_parallel1 = None;
-        let mut proj_std_parallel2 = None;
-        let mut proj_nat_origin_long = None;
-        let mut proj_nat_origin_lat = None;
-        let mut proj_false_easting = None;
-        let mut proj_false_northing = None;
-        let mut proj_false_origin_long = None;
-        let mut proj_false_origin_lat = None;
-        let mut proj_false_origin_easting = None;
-        let mut proj_false_origin_northing = None;
-        let mut proj_center_long = None;
-        let mut proj_center_lat = None;
-        let mut proj_center_easting = None;
-        let mut proj_center_northing = None;
-        let mut proj_scale_at_nat_origin = None;
-        let mut proj_scale_at_center = None;
-        let mut proj_azimuth_angle = None;
-        let mut proj_straight_vert_pole_long = None;
-
-        let mut vertical = None;
-        let mut vertical_citation = None;
-        let mut vertical_datum = None;
-        let mut vertical_units = None;
-
-        tag_data.drain().try_for_each(|(tag, value)| {
-            match tag {
-                GeoKeyTag::ModelType => model_type = Some(value.into_u16()?),
-                GeoKeyTag::RasterType => raster_type = Some(value.into_u16()?),
-                GeoKeyTag::Citation => citation = Some(value.into_string()?),
-                GeoKeyTag::GeographicType => geographic_type = Some(value.into_u16()?),
-                GeoKeyTag::GeogCitation => geog_citation = Some(value.into_string()?),
-                GeoKeyTag::GeogGeodeticDatum => geog_geodetic_datum = Some(value.into_u16()?),
-                GeoKeyTag::GeogPrimeMeridian => geog_prime_meridian = Some(value.into_u16()?),
-                GeoKeyTag::GeogLinearUnits => geog_linear_units = Some(value.into_u16()?),
-                GeoKeyTag::GeogLinearUnitSize => geog_linear_unit_size = Some(value.into_f64()?),
-                GeoKeyTag::GeogAngularUnits => geog_angular_units = Some(value.into_u16()?),
-                GeoKeyTag::GeogAngularUnitSize => geog_angular_unit_size = Some(value.into_f64()?),
-                GeoKeyTag::GeogEllipsoid => geog_ellipsoid = Some(value.into_u16()?),
-                GeoKeyTag::GeogSemiMajorAxis => geog_semi_major_axis = Some(value.into_f64()?),
-                GeoKeyTag::GeogSemiMinorAxis => geog_semi_minor_axis = Some(value.into_f64()?),
-                GeoKeyTag::GeogInvFlattening => geog_inv_flattening = Some(value.into_f64()?),
-                GeoKeyTag::GeogAzimuthUnits => geog_azimuth_units = Some(value.into_u16()?),
-                GeoKeyTag::GeogPrimeMeridianLong => {
-                    geog_prime_meridian_long = Some(value.into_f64()?)
-                }
-                GeoKeyTag::ProjectedType => projected_type = Some(value.into_u16()?),
-                GeoKeyTag::ProjCitation => proj_citation = Some(value.into_string()?),
-                GeoKeyTag::Projection => projection = Some(value.into_u16()?),
-                GeoKeyTag::ProjCoordTrans => proj_coord_trans = Some(value.into_u16()?),
-                GeoKeyTag::ProjLinearUnits => proj_linear_units = Some(value.into_u16()?),
-                GeoKeyTag::ProjLinearUnitSize => proj_linear_unit_size = Some(value.into_f64()?),
-                GeoKeyTag::ProjStdParallel1 => proj_std_parallel1 = Some(value.into_f64()?),
-                GeoKeyTag::ProjStdParallel2 => proj_std_parallel2 = Some(value.into_f64()?),
-                GeoKeyTag::ProjNatOriginLong => proj_nat_origin_long = Some(value.into_f64()?),
-                GeoKeyTag::ProjNatOriginLat => proj_nat_origin_lat = Some(value.into_f64()?),
-                GeoKeyTag::ProjFalseEasting => proj_false_easting = Some(value.into_f64()?),
-                GeoKeyTag::ProjFalseNorthing => proj_false_northing = Some(value.into_f64()?),
-                GeoKeyTag::ProjFalseOriginLong => proj_false_origin_long = Some(value.into_f64()?),
-                GeoKeyTag::ProjFalseOriginLat => proj_false_origin_lat = Some(value.into_f64()?),
-                GeoKeyTag::ProjFalseOriginEasting => {
-                    proj_false_origin_easting = Some(value.into_f64()?)
-                }
-                GeoKeyTag::ProjFalseOriginNorthing => {
-                    proj_false_origin_northing = Some(value.into_f64()?)
-                }
-                GeoKeyTag::ProjCenterLong => proj_center_long = Some(value.into_f64()?),
-                GeoKeyTag::ProjCenterLat => proj_center_lat = Some(value.into_f64()?),
-                GeoKeyTag::ProjCenterEasting => proj_center_easting = Some(value.into_f64()?),
-                GeoKeyTag::ProjCenterNorthing => proj_center_northing = Some(value.into_f64()?),
-                GeoKeyTag::ProjScaleAtNatOrigin => {
-                    proj_scale_at_nat_origin = Some(value.into_f64()?)
-                }
-                GeoKeyTag::ProjScaleAtCenter => proj_scale_at_center = Some(value.into_f64()?),
-                GeoKeyTag::ProjAzimuthAngle => proj_azimuth_angle = Some(value.into_f64()?),
-                GeoKeyTag::ProjStraightVertPoleLong => {
-                    proj_straight_vert_pole_long = Some(value.into_f64()?)
-                }
-                GeoKeyTag::Vertical => vertical = Some(value.into_u16()?),
-                GeoKeyTag::VerticalCitation => vertical_citation = Some(value.into_string()?),
-                GeoKeyTag::VerticalDatum => vertical_datum = Some(value.into_u16()?),
-                GeoKeyTag::VerticalUnits => vertical_units = Some(value.into_u16()?),
-            };
-            Ok::<_, TiffError>(())
-        })?;
-
-        Ok(Self {
-            model_type,
-            raster_type,
-            citation,
-
-            geographic_type,
-            geog_citation,
-            geog_geodetic_datum,
-            geog_prime_meridian,
-            geog_linear_units,
-            geog_linear_unit_size,
-            geog_angular_units,
-            geog_angular_unit_size,
-            geog_ellipsoid,
-            geog_semi_major_axis,
-            geog_semi_minor_axis,
-            geog_inv_flattening,
-            geog_azimuth_units,
-            geog_prime_meridian_long,
-
-            projected_type,
-            proj_citation,
-            projection,
-            proj_coord_trans,
-            proj_linear_units,
-            proj_linear_unit_size,
-            proj_std_parallel1,
-            proj_std_parallel2,
-            proj_nat_origin_long,
-            proj_nat_origin_lat,
-            proj_false_easting,
-            proj_false_northing,
-            proj_false_origin_long,
-            proj_false_origin_lat,
-            proj_false_origin_easting,
-            proj_false_origin_northing,
-            proj_center_long,
-            proj_center_lat,
-            proj_center_easting,
-            proj_center_northing,
-            proj_scale_at_nat_origin,
-            proj_scale_at_center,
-            proj_azimuth_angle,
-            proj_straight_vert_pole_long,
-
-            vertical,
-            vertical_citation,
-            vertical_datum,
-            vertical_units,
-        })
+    /// Set the field for a single GeoKey.
+    ///
+    /// Keys are applied straight from the GeoKeyDirectory entries as they are parsed, so the
+    /// directory is built in one pass without collecting the keys first.
+    pub(crate) fn set_key(&mut self, tag: GeoKeyTag, value: TagValue) -> TiffResult<()> {
+        match tag {
+            GeoKeyTag::ModelType => self.model_type = Some(value.into_u16()?),
+            GeoKeyTag::RasterType => self.raster_type = Some(value.into_u16()?),
+            GeoKeyTag::Citation => self.citation = Some(value.into_string()?),
+            GeoKeyTag::GeographicType => self.geographic_type = Some(value.into_u16()?),
+            GeoKeyTag::GeogCitation => self.geog_citation = Some(value.into_string()?),
+            GeoKeyTag::GeogGeodeticDatum => self.geog_geodetic_datum = Some(value.into_u16()?),
+            GeoKeyTag::GeogPrimeMeridian => self.geog_prime_meridian = Some(value.into_u16()?),
+            GeoKeyTag::GeogLinearUnits => self.geog_linear_units = Some(value.into_u16()?),
+            GeoKeyTag::GeogLinearUnitSize => self.geog_linear_unit_size = Some(value.into_f64()?),
+            GeoKeyTag::GeogAngularUnits => self.geog_angular_units = Some(value.into_u16()?),
+            GeoKeyTag::GeogAngularUnitSize => self.geog_angular_unit_size = Some(value.into_f64()?),
+            GeoKeyTag::GeogEllipsoid => self.geog_ellipsoid = Some(value.into_u16()?),
+            GeoKeyTag::GeogSemiMajorAxis => self.geog_semi_major_axis = Some(value.into_f64()?),
+            GeoKeyTag::GeogSemiMinorAxis => self.geog_semi_minor_axis = Some(value.into_f64()?),
+            GeoKeyTag::GeogInvFlattening => self.geog_inv_flattening = Some(value.into_f64()?),
+            GeoKeyTag::GeogAzimuthUnits => self.geog_azimuth_units = Some(value.into_u16()?),
+            GeoKeyTag::GeogPrimeMeridianLong => {
+                self.geog_prime_meridian_long = Some(value.into_f64()?)
+            }
+            GeoKeyTag::ProjectedType => self.projected_type = Some(value.into_u16()?),
+            GeoKeyTag::ProjCitation => self.proj_citation = Some(value.into_string()?),
+            GeoKeyTag::Projection => self.projection = Some(value.into_u16()?),
+            GeoKeyTag::ProjCoordTrans => self.proj_coord_trans = Some(value.into_u16()?),
+            GeoKeyTag::ProjLinearUnits => self.proj_linear_units = Some(value.into_u16()?),
+            GeoKeyTag::ProjLinearUnitSize => self.proj_linear_unit_size = Some(value.into_f64()?),
+            GeoKeyTag::ProjStdParallel1 => self.proj_std_parallel1 = Some(value.into_f64()?),
+            GeoKeyTag::ProjStdParallel2 => self.proj_std_parallel2 = Some(value.into_f64()?),
+            GeoKeyTag::ProjNatOriginLong => self.proj_nat_origin_long = Some(value.into_f64()?),
+            GeoKeyTag::ProjNatOriginLat => self.proj_nat_origin_lat = Some(value.into_f64()?),
+            GeoKeyTag::ProjFalseEasting => self.proj_false_easting = Some(value.into_f64()?),
+            GeoKeyTag::ProjFalseNorthing => self.proj_false_northing = Some(value.into_f64()?),
+            GeoKeyTag::ProjFalseOriginLong => self.proj_false_origin_long = Some(value.into_f64()?),
+            GeoKeyTag::ProjFalseOriginLat => self.proj_false_origin_lat = Some(value.into_f64()?),
+            GeoKeyTag::ProjFalseOriginEasting => {
+                self.proj_false_origin_easting = Some(value.into_f64()?)
+            }
+            GeoKeyTag::ProjFalseOriginNorthing => {
+                self.proj_false_origin_northing = Some(value.into_f64()?)
+            }
+            GeoKeyTag::ProjCenterLong => self.proj_center_long = Some(value.into_f64()?),
+            GeoKeyTag::ProjCenterLat => self.proj_center_lat = Some(value.into_f64()?),
+            GeoKeyTag::ProjCenterEasting => self.proj_center_easting = Some(value.into_f64()?),
+            GeoKeyTag::ProjCenterNorthing => self.proj_center_northing = Some(value.into_f64()?),
+            GeoKeyTag::ProjScaleAtNatOrigin => {
+                self.proj_scale_at_nat_origin = Some(value.into_f64()?)
+            }
+            GeoKeyTag::ProjScaleAtCenter => self.proj_scale_at_center = Some(value.into_f64()?),
+            GeoKeyTag::ProjAzimuthAngle => self.proj_azimuth_angle = Some(value.into_f64()?),
+            GeoKeyTag::ProjStraightVertPoleLong => {
+                self.proj_straight_vert_pole_long = Some(value.into_f64()?)
+            }
+            GeoKeyTag::Vertical => self.vertical = Some(value.into_u16()?),
+            GeoKeyTag::VerticalCitation => self.vertical_citation = Some(value.into_string()?),
+            GeoKeyTag::VerticalDatum => self.vertical_datum = Some(value.into_u16()?),
+            GeoKeyTag::VerticalUnits => self.vertical_units = Some(value.into_u16()?),
+        };
+        Ok(())
     }
 
     /// Return the EPSG code representing the crs of the image
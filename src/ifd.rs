@@ -309,7 +309,7 @@ impl ImageFileDirectory {
             let _key_minor_revision = header[2];
             let number_of_keys = header[3];
 
-            let mut tags = HashMap::with_capacity(number_of_keys as usize);
+            let mut directory = GeoKeyDirectory::default();
             for _ in 0..number_of_keys {
                 let chunk = chunks
                     .next()
@@ -331,7 +331,7 @@ impl ImageFileDirectory {
                 let value_offset = chunk[3];
 
                 if tag_location == 0 {
-                    tags.insert(tag_name, TagValue::Short(value_offset));
+                    directory.set_key(tag_name, TagValue::Short(value_offset))?;
                 } else if Tag::from_u16_exhaustive(tag_location) == Tag::GeoAsciiParams {
                     // If the tag_location points to the value of Tag::GeoAsciiParams, then we
                     // need to extract a subslice from GeoAsciiParams
@@ -348,7 +348,7 @@ impl ImageFileDirectory {
                         s = &s[0..s.len() - 1];
                     }
 
-                    tags.insert(tag_name, TagValue::Ascii(s.to_string()));
+                    directory.set_key(tag_name, TagValue::Ascii(s.to_string()))?;
                 } else if Tag::from_u16_exhaustive(tag_location) == Tag::GeoDoubleParams {
                     // If the tag_location points to the value of Tag::GeoDoubleParams, then we
                     // need to extract a subslice from GeoDoubleParams
@@ -366,10 +366,10 @@ impl ImageFileDirectory {
                             .collect();
                         TagValue::List(x)
                     };
-                    tags.insert(tag_name, value);
+                    directory.set_key(tag_name, value)?;
                 }
             }
-            geo_key_directory = Some(GeoKeyDirectory::from_tags(tags)?);
+            geo_key_directory = Some(directory);
         }
 
         let samples_per_pixel = samples_per_pixel.expect("samples_per_pixel not found");
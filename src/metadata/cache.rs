@@ -11,6 +11,8 @@ use crate::error::AsyncTiffResult;
 use crate::metadata::MetadataFetch;
 
 /// Logic for managing a cache of sequential buffers
+///
+/// Offsets are relative to the start of the cached run.
 #[derive(Debug)]
 struct SequentialBlockCache {
     /// Contiguous blocks from offset 0
@@ -96,12 +98,29 @@ impl SequentialBlockCache {
     }
 }
 
-/// A MetadataFetch implementation that caches fetched data in exponentially growing chunks,
-/// sequentially from the beginning of the file.
+/// A contiguous run of cached bytes starting at `start` in the file.
+#[derive(Debug)]
+struct CachedRun {
+    start: u64,
+    blocks: SequentialBlockCache,
+}
+
+impl CachedRun {
+    fn end(&self) -> u64 {
+        self.start + self.blocks.len
+    }
+}
+
+/// A MetadataFetch implementation that caches fetched data in exponentially growing chunks.
+///
+/// Reads are cached sequentially from the beginning of the file. A read that starts beyond what
+/// the next readahead would cover (e.g. an IFD written at the end of the file) starts a new
+/// cached run at that offset instead of fetching every byte in between, and subsequent reads near
+/// it grow that run the same way.
 #[derive(Debug)]
 pub struct ReadaheadMetadataCache<F: MetadataFetch> {
     inner: F,
-    cache: Arc<Mutex<SequentialBlockCache>>,
+    cache: Arc<Mutex<Vec<CachedRun>>>,
     initial: u64,
     multiplier: f64,
 }
@@ -111,7 +130,7 @@ impl<F: MetadataFetch> ReadaheadMetadataCache<F> {
     pub fn new(inner: F) -> Self {
         Self {
             inner,
-            cache: Arc::new(Mutex::new(SequentialBlockCache::new())),
+            cache: Arc::new(Mutex::new(vec![])),
             initial: 32 * 1024,
             multiplier: 2.0,
         }
@@ -148,25 +167,46 @@ impl<F: MetadataFetch + Send + Sync> MetadataFetch for ReadaheadMetadataCache<F>
     async fn fetch(&self, range: Range<u64>) -> AsyncTiffResult<Bytes> {
         let mut cache = self.cache.lock().await;
 
+        // Find a run that this range starts in, or close enough after that the next readahead of
+        // that run would reach it anyway. A run always starts at offset 0, so the sequential
+        // case behaves exactly as a single contiguous cache.
+        let run_idx = cache.iter().position(|run| {
+            run.start <= range.start
+                && range.start <= run.end() + self.next_fetch_size(run.blocks.len)
+        });
+        let run_idx = match run_idx {
+            Some(idx) => idx,
+            None => {
+                let start = if cache.is_empty() { 0 } else { range.start };
+                cache.push(CachedRun {
+                    start,
+                    blocks: SequentialBlockCache::new(),
+                });
+                cache.len() - 1
+            }
+        };
+        let run = &mut cache[run_idx];
+        let relative_range = range.start - run.start..range.end - run.start;
+
         // First check if we already have the range cached
-        if cache.contains(range.start..range.end) {
-            return Ok(cache.slice(range));
+        if run.blocks.contains(relative_range.clone()) {
+            return Ok(run.blocks.slice(relative_range));
         }
 
         // Compute the correct fetch range
-        let start_len = cache.len;
-        let needed = range.end.saturating_sub(start_len);
+        let start_len = run.blocks.len;
+        let needed = relative_range.end.saturating_sub(start_len);
         let fetch_size = self.next_fetch_size(start_len).max(needed);
-        let fetch_range = start_len..start_len + fetch_size;
+        let fetch_range = run.end()..run.end() + fetch_size;
 
         // Perform the fetch while holding mutex
         // (this is OK because the mutex is async)
         let bytes = self.inner.fetch(fetch_range).await?;
 
         // Now append safely
-        cache.append_buffer(bytes);
+        run.blocks.append_buffer(bytes);
 
-        Ok(cache.slice(range))
+        Ok(run.blocks.slice(relative_range))
     }
 }
 
@@ -239,6 +279,44 @@ mod test {
         assert_eq!(*cache.inner.num_fetches.lock().await, 3);
     }
 
+    #[tokio::test]
+    async fn test_readahead_cache_far_offset() {
+        let data = Bytes::from_static(b"abcdefghijklmnopqrstuvwxyz");
+        let fetch = TestFetch::new(data.clone());
+        let cache = ReadaheadMetadataCache::new(fetch)
+            .with_initial_size(2)
+            .with_multiplier(3.0);
+
+        let result = cache.fetch(0..2).await.unwrap();
+        assert_eq!(result.as_ref(), b"ab");
+        assert_eq!(*cache.inner.num_fetches.lock().await, 1);
+
+        // A request far past the readahead window starts a new run instead of fetching the gap
+        let result = cache.fetch(20..22).await.unwrap();
+        assert_eq!(result.as_ref(), b"uv");
+        assert_eq!(*cache.inner.num_fetches.lock().await, 2);
+        assert_eq!(cache.cache.lock().await.len(), 2);
+
+        let result = cache.fetch(21..22).await.unwrap();
+        assert_eq!(result.as_ref(), b"v");
+        assert_eq!(*cache.inner.num_fetches.lock().await, 2);
+
+        // The new run grows with readahead like the first one
+        let result = cache.fetch(22..24).await.unwrap();
+        assert_eq!(result.as_ref(), b"wx");
+        assert_eq!(*cache.inner.num_fetches.lock().await, 3);
+
+        // A request just past the first run still extends it, as before
+        let result = cache.fetch(4..6).await.unwrap();
+        assert_eq!(result.as_ref(), b"ef");
+        assert_eq!(*cache.inner.num_fetches.lock().await, 4);
+
+        let result = cache.fetch(6..8).await.unwrap();
+        assert_eq!(result.as_ref(), b"gh");
+        assert_eq!(*cache.inner.num_fetches.lock().await, 4);
+        assert_eq!(cache.cache.lock().await.len(), 2);
+    }
+
     #[test]
     fn test_sequential_block_cache_empty_buffers() {
         let mut cache = SequentialBlockCache::new();
@@ -48,9 +48,10 @@
 //!
 //! ### Caching/prefetching/buffering
 //!
-//! The underlying [`ImageFileDirectoryReader`] used to read tags out of the TIFF file reads each
-//! tag individually. This means that it will make many small byte range requests to the
-//! [`MetadataFetch`] implementation.
+//! The underlying [`ImageFileDirectoryReader`] used to read tags out of the TIFF file fetches all
+//! of an IFD's entries at once, but every out-of-line tag value and every IFD in the chain is
+//! still its own byte range request. This means that it will make many small byte range requests
+//! to the [`MetadataFetch`] implementation.
 //!
 //! Thus, it is **imperative to always supply some sort of caching, prefetching, or buffering**
 //! middleware when reading metadata. [`ReadaheadMetadataCache`][cache::ReadaheadMetadataCache] is
@@ -2,11 +2,12 @@ use std::collections::HashMap;
 use std::io::Read;
 
 use bytes::Bytes;
+use futures::future::try_join_all;
 
 use crate::error::{AsyncTiffError, AsyncTiffResult, TiffError, TiffFormatError};
 use crate::metadata::fetch::MetadataCursor;
 use crate::metadata::MetadataFetch;
-use crate::reader::Endianness;
+use crate::reader::{EndianAwareReader, Endianness};
 use crate::tag_value::TagValue;
 use crate::tags::{Tag, Type};
 use crate::{ImageFileDirectory, TIFF};
@@ -227,11 +228,26 @@ impl ImageFileDirectoryReader {
     /// Keep in mind that you'll still need to call [`finish`][Self::finish] to get the byte offset
     /// of the next IFD.
     pub async fn read<F: MetadataFetch>(&self, fetch: &F) -> AsyncTiffResult<ImageFileDirectory> {
-        let mut tags = HashMap::with_capacity(self.tag_count as usize);
-        for tag_idx in 0..self.tag_count {
-            let (tag, value) = self.read_tag(fetch, tag_idx).await?;
-            tags.insert(tag, value);
-        }
+        // Fetch every entry in a single request. The offset of the next IFD directly follows the
+        // entries, so include it too: a caching layer can then serve `finish` without another
+        // round trip.
+        let entries_start = self.ifd_start_offset + self.tag_count_byte_size;
+        let entries_len = self.ifd_entry_byte_size * self.tag_count;
+        let next_ifd_offset_byte_size = if self.bigtiff { 8 } else { 4 };
+        let entries = fetch
+            .fetch(entries_start..entries_start + entries_len + next_ifd_offset_byte_size)
+            .await?;
+
+        // Parse the entries concurrently, so that out-of-line values are fetched together rather
+        // than one after another.
+        let entry_size = self.ifd_entry_byte_size as usize;
+        let tags = try_join_all((0..self.tag_count as usize).map(|tag_idx| {
+            let entry = entries.slice(tag_idx * entry_size..(tag_idx + 1) * entry_size);
+            parse_tag(fetch, entry, self.endianness, self.bigtiff)
+        }))
+        .await?;
+
+        let tags: HashMap<Tag, TagValue> = tags.into_iter().collect();
         ImageFileDirectory::from_tags(tags, self.endianness)
     }
 
@@ -259,39 +275,70 @@ impl ImageFileDirectoryReader {
     }
 }
 
-/// Read a single tag from the cursor
+/// Read a single tag, fetching its IFD entry at `tag_offset`
 async fn read_tag<F: MetadataFetch>(
     fetch: &F,
     tag_offset: u64,
     endianness: Endianness,
     bigtiff: bool,
 ) -> AsyncTiffResult<(Tag, TagValue)> {
-    let mut cursor = MetadataCursor::new_with_offset(fetch, endianness, tag_offset);
+    let ifd_entry_byte_size = if bigtiff { 20 } else { 12 };
+    let entry = fetch
+        .fetch(tag_offset..tag_offset + ifd_entry_byte_size)
+        .await?;
+    parse_tag(fetch, entry, endianness, bigtiff).await
+}
+
+/// Parse a single tag out of its already-fetched IFD entry
+///
+/// Only values that don't fit in the entry's offset field need another fetch.
+async fn parse_tag<F: MetadataFetch>(
+    fetch: &F,
+    entry: Bytes,
+    endianness: Endianness,
+    bigtiff: bool,
+) -> AsyncTiffResult<(Tag, TagValue)> {
+    let mut header = EndianAwareReader::new(entry.clone(), endianness);
 
-    let tag_name = Tag::from_u16_exhaustive(cursor.read_u16().await?);
+    let tag_name = Tag::from_u16_exhaustive(header.read_u16()?);
 
-    let tag_type_code = cursor.read_u16().await?;
+    let tag_type_code = header.read_u16()?;
     let tag_type = Type::from_u16(tag_type_code).expect(
         "Unknown tag type {tag_type_code}. TODO: we should skip entries with unknown tag types.",
     );
     let count = if bigtiff {
-        cursor.read_u64().await?
+        header.read_u64()?
     } else {
-        cursor.read_u32().await?.into()
+        header.read_u32()?.into()
     };
 
-    let tag_value = read_tag_value(&mut cursor, tag_type, count, bigtiff).await?;
+    let value_field_start = if bigtiff { 12 } else { 8 };
+    let data = EndianAwareReader::new(entry.slice(value_field_start..), endianness);
+    let tag_value = read_tag_value(fetch, data, endianness, tag_type, count, bigtiff).await?;
 
     Ok((tag_name, tag_value))
 }
 
-/// Read a tag's value from the cursor
+/// Fetch `length` bytes of out-of-line tag data starting at `offset`
+async fn fetch_tag_data<F: MetadataFetch>(
+    fetch: &F,
+    endianness: Endianness,
+    offset: u64,
+    length: u64,
+) -> AsyncTiffResult<EndianAwareReader> {
+    let bytes = fetch.fetch(offset..offset + length).await?;
+    Ok(EndianAwareReader::new(bytes, endianness))
+}
+
+/// Read a tag's value, given a reader over the value/offset field of its IFD entry
 ///
-/// NOTE: this does not maintain cursor state
+/// Values that are stored out-of-line are fetched in a single request.
 // This is derived from the upstream tiff crate:
 // https://github.com/image-rs/image-tiff/blob/6dc7a266d30291db1e706c8133357931f9e2a053/src/decoder/ifd.rs#L369-L639
 async fn read_tag_value<F: MetadataFetch>(
-    cursor: &mut MetadataCursor<'_, F>,
+    fetch: &F,
+    mut data: EndianAwareReader,
+    endianness: Endianness,
     tag_type: Type,
     count: u64,
     bigtiff: bool,
@@ -319,8 +366,6 @@ async fn read_tag_value<F: MetadataFetch>(
     if count == 1 {
         // 2a: the value is 5-8 bytes and we're in BigTiff mode.
         if bigtiff && value_byte_length > 4 && value_byte_length <= 8 {
-            let mut data = cursor.read(value_byte_length).await?;
-
             return Ok(match tag_type {
                 Type::LONG8 => TagValue::UnsignedBig(data.read_u64()?),
                 Type::SLONG8 => TagValue::SignedBig(data.read_i64()?),
@@ -341,11 +386,6 @@ async fn read_tag_value<F: MetadataFetch>(
             });
         }
 
-        // NOTE: we should only be reading value_byte_length when it's 4 bytes or fewer. Right now
-        // we're reading even if it's 8 bytes, but then only using the first 4 bytes of this
-        // buffer.
-        let mut data = cursor.read(value_byte_length).await?;
-
         // 2b: the value is at most 4 bytes or doesn't fit in the offset field.
         return Ok(match tag_type {
             Type::BYTE | Type::UNDEFINED => TagValue::Byte(data.read_u8()?),
@@ -365,51 +405,50 @@ async fn read_tag_value<F: MetadataFetch>(
             }
             Type::LONG8 => {
                 let offset = data.read_u32()?;
-                cursor.seek(offset as _);
-                TagValue::UnsignedBig(cursor.read_u64().await?)
+                let mut value =
+                    fetch_tag_data(fetch, endianness, offset.into(), value_byte_length).await?;
+                TagValue::UnsignedBig(value.read_u64()?)
             }
             Type::SLONG8 => {
                 let offset = data.read_u32()?;
-                cursor.seek(offset as _);
-                TagValue::SignedBig(cursor.read_i64().await?)
+                let mut value =
+                    fetch_tag_data(fetch, endianness, offset.into(), value_byte_length).await?;
+                TagValue::SignedBig(value.read_i64()?)
             }
             Type::DOUBLE => {
                 let offset = data.read_u32()?;
-                cursor.seek(offset as _);
-                TagValue::Double(cursor.read_f64().await?)
+                let mut value =
+                    fetch_tag_data(fetch, endianness, offset.into(), value_byte_length).await?;
+                TagValue::Double(value.read_f64()?)
             }
             Type::RATIONAL => {
                 let offset = data.read_u32()?;
-                cursor.seek(offset as _);
-                let numerator = cursor.read_u32().await?;
-                let denominator = cursor.read_u32().await?;
+                let mut value =
+                    fetch_tag_data(fetch, endianness, offset.into(), value_byte_length).await?;
+                let numerator = value.read_u32()?;
+                let denominator = value.read_u32()?;
                 TagValue::Rational(numerator, denominator)
             }
             Type::SRATIONAL => {
                 let offset = data.read_u32()?;
-                cursor.seek(offset as _);
-                let numerator = cursor.read_i32().await?;
-                let denominator = cursor.read_i32().await?;
+                let mut value =
+                    fetch_tag_data(fetch, endianness, offset.into(), value_byte_length).await?;
+                let numerator = value.read_i32()?;
+                let denominator = value.read_i32()?;
                 TagValue::SRational(numerator, denominator)
             }
             Type::IFD => TagValue::Ifd(data.read_u32()?),
             Type::IFD8 => {
                 let offset = data.read_u32()?;
-                cursor.seek(offset as _);
-                TagValue::IfdBig(cursor.read_u64().await?)
+                let mut value =
+                    fetch_tag_data(fetch, endianness, offset.into(), value_byte_length).await?;
+                TagValue::IfdBig(value.read_u64()?)
             }
         });
     }
 
     // Case 3: There is more than one value, but it fits in the offset field.
     if value_byte_length <= 4 || bigtiff && value_byte_length <= 8 {
-        let mut data = cursor.read(value_byte_length).await?;
-        if bigtiff {
-            cursor.advance(8 - value_byte_length);
-        } else {
-            cursor.advance(4 - value_byte_length);
-        }
-
         match tag_type {
             Type::BYTE | Type::UNDEFINED => {
                 return {
@@ -495,13 +534,13 @@ async fn read_tag_value<F: MetadataFetch>(
         }
     }
 
-    // Seek cursor
+    // Fetch all of the values at once, rather than one value at a time.
     let offset = if bigtiff {
-        cursor.read_u64().await?
+        data.read_u64()?
     } else {
-        cursor.read_u32().await?.into()
+        data.read_u32()?.into()
     };
-    cursor.seek(offset);
+    let mut data = fetch_tag_data(fetch, endianness, offset, value_byte_length).await?;
 
     // Case 4: there is more than one value, and it doesn't fit in the offset field.
     match tag_type {
@@ -510,111 +549,104 @@ async fn read_tag_value<F: MetadataFetch>(
         Type::BYTE | Type::UNDEFINED => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::Byte(cursor.read_u8().await?))
+                v.push(TagValue::Byte(data.read_u8()?))
             }
             Ok(TagValue::List(v))
         }
         Type::SBYTE => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::SignedByte(cursor.read_i8().await?))
+                v.push(TagValue::SignedByte(data.read_i8()?))
             }
             Ok(TagValue::List(v))
         }
         Type::SHORT => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::Short(cursor.read_u16().await?))
+                v.push(TagValue::Short(data.read_u16()?))
             }
             Ok(TagValue::List(v))
         }
         Type::SSHORT => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::SignedShort(cursor.read_i16().await?))
+                v.push(TagValue::SignedShort(data.read_i16()?))
             }
             Ok(TagValue::List(v))
         }
         Type::LONG => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::Unsigned(cursor.read_u32().await?))
+                v.push(TagValue::Unsigned(data.read_u32()?))
             }
             Ok(TagValue::List(v))
         }
         Type::SLONG => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::Signed(cursor.read_i32().await?))
+                v.push(TagValue::Signed(data.read_i32()?))
             }
             Ok(TagValue::List(v))
         }
         Type::FLOAT => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::Float(cursor.read_f32().await?))
+                v.push(TagValue::Float(data.read_f32()?))
             }
             Ok(TagValue::List(v))
         }
         Type::DOUBLE => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::Double(cursor.read_f64().await?))
+                v.push(TagValue::Double(data.read_f64()?))
             }
             Ok(TagValue::List(v))
         }
         Type::RATIONAL => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::Rational(
-                    cursor.read_u32().await?,
-                    cursor.read_u32().await?,
-                ))
+                v.push(TagValue::Rational(data.read_u32()?, data.read_u32()?))
             }
             Ok(TagValue::List(v))
         }
         Type::SRATIONAL => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::SRational(
-                    cursor.read_i32().await?,
-                    cursor.read_i32().await?,
-                ))
+                v.push(TagValue::SRational(data.read_i32()?, data.read_i32()?))
             }
             Ok(TagValue::List(v))
         }
         Type::LONG8 => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::UnsignedBig(cursor.read_u64().await?))
+                v.push(TagValue::UnsignedBig(data.read_u64()?))
             }
             Ok(TagValue::List(v))
         }
         Type::SLONG8 => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::SignedBig(cursor.read_i64().await?))
+                v.push(TagValue::SignedBig(data.read_i64()?))
             }
             Ok(TagValue::List(v))
         }
         Type::IFD => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::Ifd(cursor.read_u32().await?))
+                v.push(TagValue::Ifd(data.read_u32()?))
             }
             Ok(TagValue::List(v))
         }
         Type::IFD8 => {
             let mut v = Vec::with_capacity(count as _);
             for _ in 0..count {
-                v.push(TagValue::IfdBig(cursor.read_u64().await?))
+                v.push(TagValue::IfdBig(data.read_u64()?))
             }
             Ok(TagValue::List(v))
         }
         Type::ASCII => {
             let mut out = vec![0; count as _];
-            let mut buf = cursor.read(count).await?;
-            buf.read_exact(&mut out)?;
+            data.read_exact(&mut out)?;
 
             // Strings may be null-terminated, so we trim anything downstream of the null byte
             if let Some(first) = out.iter().position(|&b| b == 0) {
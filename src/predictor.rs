@@ -73,11 +73,7 @@ pub(crate) fn unpredict_hdiff(
 /// Reverse one row of horizontal differencing, dispatched by bit depth.
 fn rev_hpredict_row(row: &mut [u8], bits_per_sample: u16, samples: usize) {
     match bits_per_sample {
-        0..=8 => {
-            for i in samples..row.len() {
-                row[i] = row[i].wrapping_add(row[i - samples]);
-            }
-        }
+        0..=8 => rev_hpredict_u8(row, samples),
         9..=16 => {
             for i in (samples * 2..row.len()).step_by(2) {
                 let v = u16::from_ne_bytes(row[i..][..2].try_into().unwrap());
@@ -103,6 +99,19 @@ fn rev_hpredict_row(row: &mut [u8], bits_per_sample: u16, samples: usize) {
     }
 }
 
+/// Reverse byte-wise horizontal differencing, where each byte is a delta from the byte `stride`
+/// positions before it.
+fn rev_hpredict_u8(row: &mut [u8], stride: usize) {
+    #[cfg(target_arch = "x86_64")]
+    if stride == 1 {
+        return x86::rev_hpredict_u8_stride1(row);
+    }
+
+    for i in stride..row.len() {
+        row[i] = row[i].wrapping_add(row[i - stride]);
+    }
+}
+
 /// Reverse floating-point predictor (Predictor=3).
 ///
 /// Operates on the **full encoded tile width** — `tile_width` must be the nominal tile width,
@@ -120,31 +129,30 @@ pub(crate) fn unpredict_float(
 ) -> AsyncTiffResult<Vec<u8>> {
     let bytes_per_sample = (bits_per_sample as usize) / 8;
     let row_stride = tile_width * samples * bytes_per_sample;
-    let mut out = vec![0u8; buffer.len()];
+    // Each row is reassembled into this scratch row and copied back, so the tile is unpredicted
+    // in place rather than into a second tile-sized buffer.
+    let mut scratch = vec![0u8; row_stride];
 
-    for (in_row, out_row) in buffer
-        .chunks_mut(row_stride)
-        .zip(out.chunks_mut(row_stride))
-    {
+    for row in buffer.chunks_mut(row_stride) {
+        let out_row = &mut scratch[..row.len()];
         match bits_per_sample {
-            16 => rev_predict_f16(in_row, out_row, samples),
-            32 => rev_predict_f32(in_row, out_row, samples),
-            64 => rev_predict_f64(in_row, out_row, samples),
+            16 => rev_predict_f16(row, out_row, samples),
+            32 => rev_predict_f32(row, out_row, samples),
+            64 => rev_predict_f64(row, out_row, samples),
             _ => {
                 return Err(AsyncTiffError::General(format!(
                     "Floating-point predictor not supported for {bits_per_sample}-bit samples"
                 )))
             }
         }
+        row.copy_from_slice(out_row);
     }
 
-    Ok(out)
+    Ok(buffer)
 }
 
 fn rev_predict_f16(input: &mut [u8], output: &mut [u8], samples: usize) {
-    for i in samples..input.len() {
-        input[i] = input[i].wrapping_add(input[i - samples]);
-    }
+    rev_hpredict_u8(input, samples);
     for (i, chunk) in output.chunks_exact_mut(2).enumerate() {
         chunk.copy_from_slice(&u16::to_ne_bytes(u16::from_be_bytes([
             input[i],
@@ -154,10 +162,14 @@ fn rev_predict_f16(input: &mut [u8], output: &mut [u8], samples: usize) {
 }
 
 fn rev_predict_f32(input: &mut [u8], output: &mut [u8], samples: usize) {
-    for i in samples..input.len() {
-        input[i] = input[i].wrapping_add(input[i - samples]);
-    }
-    for (i, chunk) in output.chunks_exact_mut(4).enumerate() {
+    rev_hpredict_u8(input, samples);
+
+    #[cfg(target_arch = "x86_64")]
+    let start = x86::interleave_f32_planes(input, output);
+    #[cfg(not(target_arch = "x86_64"))]
+    let start = 0;
+
+    for (i, chunk) in output.chunks_exact_mut(4).enumerate().skip(start) {
         chunk.copy_from_slice(&u32::to_ne_bytes(u32::from_be_bytes([
             input[i],
             input[input.len() / 4 + i],
@@ -168,9 +180,7 @@ fn rev_predict_f32(input: &mut [u8], output: &mut [u8], samples: usize) {
 }
 
 fn rev_predict_f64(input: &mut [u8], output: &mut [u8], samples: usize) {
-    for i in samples..input.len() {
-        input[i] = input[i].wrapping_add(input[i - samples]);
-    }
+    rev_hpredict_u8(input, samples);
     for (i, chunk) in output.chunks_exact_mut(8).enumerate() {
         chunk.copy_from_slice(&u64::to_ne_bytes(u64::from_be_bytes([
             input[i],
@@ -184,3 +194,142 @@ fn rev_predict_f64(input: &mut [u8], output: &mut [u8], samples: usize) {
         ])));
     }
 }
+
+/// SSE2 kernels for the byte-oriented parts of the predictors.
+///
+/// SSE2 is part of the x86_64 baseline, so these need no runtime feature detection.
+#[cfg(target_arch = "x86_64")]
+mod x86 {
+    use std::arch::x86_64::*;
+
+    /// Reverse horizontal differencing with a stride of one byte, 16 bytes at a time.
+    ///
+    /// Each 16-byte block is turned into its prefix sum with four shift-and-add steps, then the
+    /// running total from the previous block is added to every lane.
+    pub(super) fn rev_hpredict_u8_stride1(row: &mut [u8]) {
+        let mut chunks = row.chunks_exact_mut(16);
+        let mut carry = 0u8;
+        for chunk in &mut chunks {
+            // SAFETY: `chunk` is exactly 16 bytes long, so the unaligned load and store stay in
+            // bounds.
+            unsafe {
+                let mut x = _mm_loadu_si128(chunk.as_ptr() as *const __m128i);
+                x = _mm_add_epi8(x, _mm_slli_si128(x, 1));
+                x = _mm_add_epi8(x, _mm_slli_si128(x, 2));
+                x = _mm_add_epi8(x, _mm_slli_si128(x, 4));
+                x = _mm_add_epi8(x, _mm_slli_si128(x, 8));
+                x = _mm_add_epi8(x, _mm_set1_epi8(carry as i8));
+                _mm_storeu_si128(chunk.as_mut_ptr() as *mut __m128i, x);
+            }
+            carry = chunk[15];
+        }
+        for v in chunks.into_remainder() {
+            carry = carry.wrapping_add(*v);
+            *v = carry;
+        }
+    }
+
+    /// Interleave the four big-endian byte planes of a float predictor row back into native
+    /// (little-endian) `f32` values, 16 values at a time.
+    ///
+    /// Returns the number of values written; the caller handles the remaining tail.
+    pub(super) fn interleave_f32_planes(input: &[u8], output: &mut [u8]) -> usize {
+        let n = input.len() / 4;
+        let simd_n = n - n % 16;
+        assert!(output.len() >= n * 4);
+
+        let (p0, p1, p2, p3) = (
+            &input[..n],
+            &input[n..2 * n],
+            &input[2 * n..3 * n],
+            &input[3 * n..4 * n],
+        );
+        for i in (0..simd_n).step_by(16) {
+            // SAFETY: `i + 16 <= simd_n <= n`, so each 16-byte load stays within its plane, and
+            // the four 16-byte stores cover `output[4 * i..4 * i + 64]`, which is within
+            // `output[..4 * n]`.
+            unsafe {
+                let a = _mm_loadu_si128(p0.as_ptr().add(i) as *const __m128i);
+                let b = _mm_loadu_si128(p1.as_ptr().add(i) as *const __m128i);
+                let c = _mm_loadu_si128(p2.as_ptr().add(i) as *const __m128i);
+                let d = _mm_loadu_si128(p3.as_ptr().add(i) as *const __m128i);
+
+                // Plane 0 holds the most significant byte, so it goes last in little-endian order.
+                let dc_lo = _mm_unpacklo_epi8(d, c);
+                let dc_hi = _mm_unpackhi_epi8(d, c);
+                let ba_lo = _mm_unpacklo_epi8(b, a);
+                let ba_hi = _mm_unpackhi_epi8(b, a);
+
+                let out = output.as_mut_ptr().add(4 * i) as *mut __m128i;
+                _mm_storeu_si128(out, _mm_unpacklo_epi16(dc_lo, ba_lo));
+                _mm_storeu_si128(out.add(1), _mm_unpackhi_epi16(dc_lo, ba_lo));
+                _mm_storeu_si128(out.add(2), _mm_unpacklo_epi16(dc_hi, ba_hi));
+                _mm_storeu_si128(out.add(3), _mm_unpackhi_epi16(dc_hi, ba_hi));
+            }
+        }
+        simd_n
+    }
+}
+
+#[cfg(test)]
+mod test {
+    use super::*;
+
+    /// Deterministic pseudo-random bytes
+    fn test_bytes(len: usize) -> Vec<u8> {
+        let mut state = 0x2545_f491_u32;
+        (0..len)
+            .map(|_| {
+                state = state.wrapping_mul(1_664_525).wrapping_add(1_013_904_223);
+                (state >> 24) as u8
+            })
+            .collect()
+    }
+
+    #[test]
+    fn test_rev_hpredict_u8_matches_scalar() {
+        for len in [0, 1, 15, 16, 17, 31, 32, 100, 1024] {
+            for stride in [1, 2, 3, 4] {
+                let mut expected = test_bytes(len);
+                for i in stride..expected.len() {
+                    expected[i] = expected[i].wrapping_add(expected[i - stride]);
+                }
+
+                let mut actual = test_bytes(len);
+                rev_hpredict_u8(&mut actual, stride);
+                assert_eq!(actual, expected, "len={len}, stride={stride}");
+            }
+        }
+    }
+
+    #[test]
+    fn test_rev_predict_f32_matches_scalar() {
+        for width in [1, 15, 16, 17, 64, 100] {
+            for samples in [1, 3] {
+                let len = width * samples * 4;
+
+                let mut expected_input = test_bytes(len);
+                for i in samples..expected_input.len() {
+                    expected_input[i] = expected_input[i].wrapping_add(expected_input[i - samples]);
+                }
+                let n = len / 4;
+                let expected = (0..n)
+                    .flat_map(|i| {
+                        u32::from_be_bytes([
+                            expected_input[i],
+                            expected_input[n + i],
+                            expected_input[2 * n + i],
+                            expected_input[3 * n + i],
+                        ])
+                        .to_ne_bytes()
+                    })
+                    .collect::<Vec<_>>();
+
+                let mut input = test_bytes(len);
+                let mut actual = vec![0; len];
+                rev_predict_f32(&mut input, &mut actual, samples);
+                assert_eq!(actual, expected, "width={width}, samples={samples}");
+            }
+        }
+    }
+}
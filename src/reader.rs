@@ -11,7 +11,7 @@ use bytes::buf::Reader;
 use bytes::{Buf, Bytes};
 use futures::TryFutureExt;
 
-use crate::error::AsyncTiffResult;
+use crate::error::{AsyncTiffError, AsyncTiffResult};
 
 /// The asynchronous interface used to read COG files
 ///
@@ -75,6 +75,118 @@ impl AsyncFileReader for Arc<dyn AsyncFileReader + '_> {
     }
 }
 
+/// An [`AsyncFileReader`] wrapper that coalesces nearby byte ranges into fewer, larger requests.
+///
+/// Ranges passed to [`get_byte_ranges`][AsyncFileReader::get_byte_ranges] are sorted by offset and
+/// greedily merged whenever the gap between neighbouring ranges is smaller than the coalesce gap,
+/// as long as the merged window stays within the maximum window size. The inner reader receives a
+/// single `get_byte_ranges` call with the merged windows, and each requested range is then sliced
+/// back out of its window without copying.
+///
+/// This is useful for backends that issue one request per range, where per-request latency
+/// dominates. [`ObjectReader`] does not need this, as `object_store` already coalesces ranges
+/// internally.
+#[derive(Debug)]
+pub struct CoalescingReader<F: AsyncFileReader> {
+    inner: F,
+    coalesce_gap: u64,
+    max_window_size: u64,
+}
+
+impl<F: AsyncFileReader> CoalescingReader<F> {
+    /// Create a new CoalescingReader wrapping the given AsyncFileReader
+    pub fn new(inner: F) -> Self {
+        Self {
+            inner,
+            coalesce_gap: 4 * 1024,
+            max_window_size: 16 * 1024 * 1024,
+        }
+    }
+
+    /// Access the inner AsyncFileReader
+    pub fn inner(&self) -> &F {
+        &self.inner
+    }
+
+    /// Set the largest gap in bytes between two ranges that will still be merged into one
+    /// request, otherwise defaults to 4 KiB
+    pub fn with_coalesce_gap(mut self, coalesce_gap: u64) -> Self {
+        self.coalesce_gap = coalesce_gap;
+        self
+    }
+
+    /// Set the maximum size in bytes of a merged request, otherwise defaults to 16 MiB
+    ///
+    /// A single range larger than this is still fetched, as its own request.
+    pub fn with_max_window_size(mut self, max_window_size: u64) -> Self {
+        self.max_window_size = max_window_size;
+        self
+    }
+}
+
+/// Merge `ranges` into windows, returning the windows and the index of the window that contains
+/// each input range.
+fn coalesce_ranges(
+    ranges: &[Range<u64>],
+    coalesce_gap: u64,
+    max_window_size: u64,
+) -> (Vec<Range<u64>>, Vec<usize>) {
+    let mut order = (0..ranges.len()).collect::<Vec<_>>();
+    order.sort_unstable_by_key(|&i| ranges[i].start);
+
+    let mut windows: Vec<Range<u64>> = vec![];
+    let mut assignments = vec![0; ranges.len()];
+    for i in order {
+        let range = &ranges[i];
+        match windows.last_mut() {
+            Some(window)
+                if range.start <= window.end.saturating_add(coalesce_gap)
+                    && range.end.max(window.end) - window.start <= max_window_size =>
+            {
+                window.end = window.end.max(range.end);
+            }
+            _ => windows.push(range.clone()),
+        }
+        assignments[i] = windows.len() - 1;
+    }
+
+    (windows, assignments)
+}
+
+#[async_trait]
+impl<F: AsyncFileReader> AsyncFileReader for CoalescingReader<F> {
+    async fn get_bytes(&self, range: Range<u64>) -> AsyncTiffResult<Bytes> {
+        self.inner.get_bytes(range).await
+    }
+
+    async fn get_byte_ranges(&self, ranges: Vec<Range<u64>>) -> AsyncTiffResult<Vec<Bytes>> {
+        if ranges.len() <= 1 {
+            return self.inner.get_byte_ranges(ranges).await;
+        }
+
+        let (windows, assignments) =
+            coalesce_ranges(&ranges, self.coalesce_gap, self.max_window_size);
+        let buffers = self.inner.get_byte_ranges(windows.clone()).await?;
+
+        ranges
+            .iter()
+            .zip(assignments)
+            .map(|(range, window_idx)| {
+                let buffer = &buffers[window_idx];
+                let start = (range.start - windows[window_idx].start) as usize;
+                let end = (range.end - windows[window_idx].start) as usize;
+                if end > buffer.len() {
+                    return Err(AsyncTiffError::EndOfFile(
+                        range.end - range.start,
+                        buffer.len().saturating_sub(start) as u64,
+                    ));
+                }
+                Ok(buffer.slice(start..end))
+            })
+            .collect()
+    }
+}
+
 /// A wrapper for things that implement [AsyncRead] and [AsyncSeek] to also implement
 /// [AsyncFileReader].
 ///
@@ -103,8 +215,6 @@ impl<T: tokio::io::AsyncRead + tokio::io::AsyncSeek + Unpin + Send + Debug> Toki
 
         use tokio::io::{AsyncReadExt, AsyncSeekExt};
 
-        use crate::error::AsyncTiffError;
-
         let mut file = self.0.lock().await;
 
         file.seek(SeekFrom::Start(range.start)).await?;
@@ -348,3 +458,63 @@ impl Read for EndianAwareReader {
         self.reader.read(buf)
     }
 }
+
+#[cfg(test)]
+mod test {
+    use tokio::sync::Mutex;
+
+    use super::*;
+
+    #[derive(Debug)]
+    struct TestReader {
+        data: Bytes,
+        /// The ranges that actually reach the raw reader, per `get_byte_ranges` call
+        requests: Mutex<Vec<Vec<Range<u64>>>>,
+    }
+
+    #[async_trait]
+    impl AsyncFileReader for TestReader {
+        async fn get_bytes(&self, range: Range<u64>) -> AsyncTiffResult<Bytes> {
+            Ok(self.data.slice(range.start as usize..range.end as usize))
+        }
+
+        async fn get_byte_ranges(&self, ranges: Vec<Range<u64>>) -> AsyncTiffResult<Vec<Bytes>> {
+            self.requests.lock().await.push(ranges.clone());
+            Ok(ranges
+                .into_iter()
+                .map(|r| self.data.slice(r.start as usize..r.end as usize))
+                .collect())
+        }
+    }
+
+    #[test]
+    fn test_coalesce_ranges() {
+        let ranges = vec![20..30, 0..10, 12..15, 100..110, 28..40];
+        let (windows, assignments) = coalesce_ranges(&ranges, 4, 1024);
+        assert_eq!(windows, vec![0..15, 20..40, 100..110]);
+        assert_eq!(assignments, vec![1, 0, 0, 2, 1]);
+
+        // The window size limit splits otherwise adjacent ranges
+        let (windows, _) = coalesce_ranges(&ranges, 4, 16);
+        assert_eq!(windows, vec![0..15, 20..30, 28..40, 100..110]);
+    }
+
+    #[tokio::test]
+    async fn test_coalescing_reader() {
+        let data = Bytes::from((0..=255).collect::<Vec<u8>>());
+        let reader = CoalescingReader::new(TestReader {
+            data: data.clone(),
+            requests: Mutex::new(vec![]),
+        })
+        .with_coalesce_gap(8);
+
+        let ranges = vec![50..60, 0..10, 12..20, 200..256];
+        let result = reader.get_byte_ranges(ranges.clone()).await.unwrap();
+        for (range, bytes) in ranges.iter().zip(&result) {
+            assert_eq!(bytes, &data.slice(range.start as usize..range.end as usize));
+        }
+
+        let requests = reader.inner().requests.lock().await;
+        assert_eq!(*requests, vec![vec![0..20, 50..60, 200..256]]);
+    }
+}
@@ -89,15 +89,19 @@ impl Tile {
         let bits_per_sample = self.bits_per_sample;
         // tile_width is the full encoded tile width — predictor must use this, not the cropped width
         let tile_width = self.width as usize;
+        // Rows are padded to a byte boundary, which matters for sub-byte samples.
+        let decoded_row_size =
+            |samples: usize| (tile_width * samples * bits_per_sample as usize).div_ceil(8);
 
         let mut decoded_tile = match &self.compressed_bytes {
-            CompressedBytes::Chunky(bytes) => decoder.decode_tile(
+            CompressedBytes::Chunky(bytes) => decoder.decode_tile_with_size_hint(
                 bytes.clone(),
                 self.photometric_interpretation,
                 self.jpeg_tables.as_deref(),
                 self.samples_per_pixel,
                 bits_per_sample,
                 self.lerc_parameters.as_deref(),
+                decoded_row_size(samples) * self.height as usize,
             )?,
             CompressedBytes::Planar(band_bytes) => {
                 let bytes_per_sample = (bits_per_sample as usize).div_ceil(8);
@@ -106,13 +110,14 @@ impl Tile {
                 let mut result = Vec::with_capacity(total_size);
 
                 for band_data in band_bytes {
-                    let decoded_band = decoder.decode_tile(
+                    let decoded_band = decoder.decode_tile_with_size_hint(
                         band_data.clone(),
                         self.photometric_interpretation,
                         self.jpeg_tables.as_deref(),
                         1,
                         bits_per_sample,
                         self.lerc_parameters.as_deref(),
+                        decoded_row_size(1) * self.height as usize,
                     )?;
                     result.extend_from_slice(&decoded_band);
                 }